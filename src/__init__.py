@@ -19,6 +19,12 @@ Subpackages:
 
 """
 
+import pandas as pd
+
+# Copy-on-Write: selections and filters share memory until they are modified,
+# so cleaning/engine steps don't need defensive .copy() calls on every subset.
+pd.options.mode.copy_on_write = True
+
 #Import modules to be exposed at the package level
 from . import core, cleaning, engines, visualization, outputs
 __all__ = [
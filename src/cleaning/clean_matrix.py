@@ -57,6 +57,9 @@ Core transformations
        Convert to numeric and store as pandas nullable integer (Int64).
    - Text fields (participant name, state, plan_id, transaction type):
        Strip whitespace and standardize casing where appropriate.
+   - Low-cardinality text (matrix_account, state, txn_method, dist_type,
+     tax_form, federal_taxing_method):
+       Stored as pandas categoricals once cleaned.
 
 3) Filtering (noise reduction)
    Filter out rows that are not meaningful for distribution matching/corrections:
@@ -94,6 +97,12 @@ Public API
 ----------
 - clean_matrix(path: str | Path) -> pd.DataFrame
     Main entrypoint. Returns a cleaned DataFrame ready for matching/correction engines.
+- clean_matrix_chunks(chunks: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]
+    Streaming variant for very large exports read in pieces; yields cleaned
+    chunks with duplicates removed across chunk boundaries.
+- load_clean_matrix(path=None, use_cache=False, date_filter=None) -> pd.DataFrame
+    Load and clean the Matrix export in one step, optionally reusing a
+    cached cleaned frame while the export is unchanged.
 
 - (optional helper functions)
     Internal helpers may include SSN and tax code normalization functions.
@@ -109,20 +118,33 @@ production version only in secure environments with appropriate access controls.
 from __future__ import annotations
 
 import re
-from numbers import Integral, Real
-from typing import Iterable
+from numbers import Integral
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
 import warnings
 
+import numpy as np
 import pandas as pd
+from pandas.api.types import is_bool_dtype, is_integer_dtype, is_numeric_dtype
 
 from ..config import (
+    CLEANING_CACHE_VERSION,
     DateFilterConfig,
     MATRIX_COLUMN_MAP,
     MATRIX_CORE_COLUMNS,
     MATRIX_MATCH_KEYS,
 )
+from ..core.load_data import (
+    cached_frame,
+    load_matrix_excel,
+    resolve_matrix_path,
+)
 
 from ..core.normalizers import (
+    _digits_only,
+    _first_row_positions,
+    _normalize_distinct,
+    _numeric_cell_mask,
     apply_date_filter,
     normalize_plan_id_series,
     normalize_ssn_series,
@@ -136,6 +158,7 @@ from ..core.normalizers import (
 from ..core.validators import (
     build_validation_issues,
     cross_validate_series,
+    normalize_date_filter_config,
     validate_amounts_series,
     validate_dates_series,
     validate_1099r_code_series,
@@ -146,92 +169,191 @@ from ..core.validators import (
 
 # Refer to notes in src/clean_relius.py for better understanding in helpfer funtions...
 
-# --- Helper functions ------------------------------------------------------------
+# Transaction ID patterns, compiled once at import.
+_RE_FLOAT_ID = re.compile(r"^(\d+)\.0+$")        # '44324568.0' -> group '44324568'
+_RE_LETTER = re.compile(r"[A-Za-z]")
+
+# Low-cardinality descriptive text columns (a handful of distinct values per
+# export), cleaned once per distinct value and stored as categoricals: one small
+# integer code per row instead of one string object, and `==` / `isin` against
+# them compare codes. Columns the engines write into (tax codes, plan_id) stay
+# pandas string dtype.
+_MATRIX_CATEGORY_COLUMNS = (
+    "matrix_account",
+    "state",
+    "txn_method",
+    "dist_type",
+    "tax_form",
+    "federal_taxing_method",
+)
 
+# --- Helper functions ------------------------------------------------------------
 
-def _drop_unneeded_columns(df: pd.DataFrame, keep: Iterable[str]) -> pd.DataFrame:
 
+def _normalize_as_category(
+        series: pd.Series,
+        normalize: Callable[[pd.Series], pd.Series],
+) -> pd.Series:
     """
-    
-    Keep only specified columns (ignore others).
+    Apply a text normalizer to the distinct values only; return a categorical.
 
-    Returns a shallow copy with just the desired columns.
-    
+    The column is factorized once, normalize() runs on its few distinct values,
+    and values that normalize to the same text (' ACH' / 'ACH') are merged into
+    one category. Categories come out sorted, as astype("category") would.
     """
+    codes, uniques = pd.factorize(series)
+    normalized = normalize(pd.Series(uniques))
+    category_codes, categories = pd.factorize(normalized, sort=True)
+    # Trailing -1 slot: code -1 (missing value) indexes it.
+    row_codes = np.append(category_codes, -1)[codes]
+    return pd.Series(
+        pd.Categorical.from_codes(row_codes, dtype=pd.CategoricalDtype(categories)),
+        index=series.index,
+    )
 
-    cols = [c for c in keep if c in df.columns]
-    return df[cols].copy()
 
 
-def _normalize_transaction_id(value) -> str | pd.NA:
+def _select_core_columns(
+        raw_df: pd.DataFrame,
+        column_map: dict[str, str],
+        keep: Iterable[str],
+) -> pd.DataFrame:
 
     """
     
-    Normalize Transaction ID values.
+    Rename raw columns to canonical names and keep only the specified ones,
+    in a single projection.
 
-    Matrix reads them as floats, examples when getting to DataFrame:
-        '44324568' -> 44324568.0
-
-    We want just the original transaction ID, without the decimal 0
+    Same columns, names and order as raw_df.rename(columns=column_map)[keep]
+    (keep order, missing ones ignored), but only the kept columns are taken
+    from the raw frame and relabelled; a wide export's other columns are never
+    touched. Copy-on-Write: the column data is shared, no copy is made here.
     
-    Logic:
-    - Convert to string, strip
-    - Find the first numeric digits "\\d" before the ending 0 and return it
-    - If nothing found, return <NA>
-
     """
 
-    if pd.isna(value):
-        return pd.NA
-    
-    if isinstance(value, Integral) and not isinstance(value, bool):
-        return str(int(value))
-
-    if isinstance(value, Real) and not isinstance(value, Integral):
-        if pd.isna(value):
-            return pd.NA
-        if value.is_integer():
-            return str(int(value))
-        return pd.NA
+    canonical = [column_map.get(col, col) for col in raw_df.columns]
+    positions_by_name: dict[str, list[int]] = {}
+    for pos, name in enumerate(canonical):
+        positions_by_name.setdefault(name, []).append(pos)
 
-    text = str(value).strip()
-    if not text:
-        return pd.NA
-
-    m = re.fullmatch(r"(\d+)\.0+", text)
-    if m:
-        return m.group(1)
+    positions = [pos for col in keep for pos in positions_by_name.get(col, [])]
+    return raw_df.iloc[:, positions].set_axis(
+        [canonical[pos] for pos in positions], axis=1
+    )
 
-    if re.fullmatch(r"\d+", text):
-        return text
 
-    if re.search(r"[A-Za-z]", text):
-        return pd.NA
+def _whole_number_text(value: object) -> str | None:
+    """Digits of a whole number (exact for ints of any size), else None."""
+    if isinstance(value, Integral):
+        return str(int(value))
+    try:
+        whole = int(value)
+    except (OverflowError, ValueError, TypeError):              # inf / nan / non-numeric
+        return None
+    return str(whole) if whole == value else None
 
-    text = re.sub(r"\D", "", text)
-    if not text:
-        return pd.NA
 
-    return text
+def _normalize_transaction_id_series(series: pd.Series) -> pd.Series:
+    """
+    Normalize Transaction ID values, column-wide.
+
+    Matrix reads them as floats (e.g. '44324568' -> 44324568.0); we want just
+    the original ID, without the decimal 0:
+    - numeric cells keep their whole-number digits (44324568.0 -> '44324568',
+      fractional values -> <NA>)
+    - text cells are stripped; '<digits>.0' keeps its digits, text containing
+      letters -> <NA>, otherwise every non-digit is dropped
+    - empty results -> <NA>
+    """
+    dtype = series.dtype
+    if is_numeric_dtype(dtype) and not is_bool_dtype(dtype):
+        # Whole-column fast path (the usual Excel read: every ID a float):
+        #   no per-cell masks or label-aligned assignment, and the digits come
+        #   from Python ints in one list build instead of an int -> string astype
+        text = np.full(len(series), pd.NA, dtype=object)
+        if is_integer_dtype(dtype):
+            # Integers never go through float64: IDs above 2**53 keep every digit
+            keep = series.notna().to_numpy(dtype=bool)
+            text[keep] = [str(i) for i in series[keep].tolist()]
+        else:
+            numbers = series.to_numpy(dtype=np.float64, na_value=np.nan)
+            keep = np.isfinite(numbers)
+            keep[keep] = numbers[keep] % 1 == 0
+            # Only whole floats inside the int64 range take the vectorized cast;
+            # the (rare) larger ones go through int() so they cannot wrap
+            small = keep & (np.abs(numbers) < 2**63)
+            text[small] = [str(i) for i in numbers[small].astype(np.int64).tolist()]
+            large = keep & ~small
+            if large.any():
+                text[large] = [str(int(v)) for v in numbers[large].tolist()]
+        return pd.Series(pd.array(text, dtype="string"), index=series.index)
+
+    # Filled by position and wrapped with the original index once at the end,
+    # so duplicate index labels (e.g. after a concat) are fine
+    present = series.notna().to_numpy(dtype=bool)
+    numeric_mask = present & _numeric_cell_mask(series).to_numpy(dtype=bool)
+    text_mask = present & ~numeric_mask
+
+    ids = np.full(len(series), pd.NA, dtype=object)
+
+    if numeric_mask.any():
+        # Numeric cells of a mixed object column: converted one by one from the
+        # original objects, so large Python ints keep all their digits
+        positions = np.flatnonzero(numeric_mask)
+        ids[positions] = [_whole_number_text(v) for v in series.iloc[positions]]
+
+    if text_mask.any():
+        positions = np.flatnonzero(text_mask)
+        text = series.iloc[positions].reset_index(drop=True).astype("string").str.strip()
+        # Fast path: IDs that are already bare digits (the usual text shape)
+        # are kept as is, with no regex work; str.isdecimal is the same class as \d.
+        bare = text.str.isdecimal().to_numpy(dtype=bool)
+        ids[positions[bare]] = text[bare].to_numpy(dtype=object)
+        if not bare.all():
+            text = text[~bare]
+            text = text.str.replace(_RE_FLOAT_ID, r"\1", regex=True)      # '44324568.0' -> '44324568'
+            has_letters = text.str.contains(_RE_LETTER, regex=True).to_numpy(dtype=bool)
+            ids[positions[~bare]] = [
+                pd.NA if letters else _digits_only(t) for t, letters in zip(text, has_letters)
+            ]
+
+    ids = pd.array(ids, dtype="string")
+    return pd.Series(ids, index=series.index).mask(ids == "")
 
 
 
 # --- Filter configuration specific to Matrix -------------------------------------
 
 # Matrix accounts we want to completely ignore for matching
-IGNORED_MATRIX_ACCOUNTS = {
+IGNORED_MATRIX_ACCOUNTS = frozenset({
     "07B00442",
     "07I00442",
     '07M00442',
-}
+})
 
 # Transaction types that are not true distributions for our purposes
-IGNORED_TXN_METHODS = {
+IGNORED_TXN_METHODS = frozenset({
     "account transfer",
     "suspense transfer",
     "ach distribution reject",
     "check stop",
-}
+})
+
+
+def _ignored_category_mask(
+        categorical: pd.Series,
+        ignored: frozenset[str],
+        lower: bool = False,
+) -> np.ndarray:
+    """
+    Return a bool ndarray: True where a text categorical's value is in ignored.
+
+    Only the categories are tested (lowercased when lower=True); the result
+    is broadcast back to rows by category code. Missing values never match.
+    """
+    hits = [(c.lower() if lower else c) in ignored for c in categorical.cat.categories]
+    # Trailing False slot: code -1 (missing value) indexes it.
+    return np.array(hits + [False], dtype=bool)[categorical.cat.codes.to_numpy()]
 
 
 
@@ -254,9 +376,12 @@ def clean_matrix(
         - rows with matrix_account in IGNORED_MATRIX_ACCOUNTS
         - rows with txn_method in IGNORED_TXN_METHODS
     4. Clean SSNs, dates, amounts, tax codes, and text fields
-    5. Apply optional transaction-date filters (range/months)
+    5. Apply optional transaction-date filters (range/months), right after
+       the dates are cleaned so the other fields are cleaned only for rows
+       in the window
     6. Optionally drop rows missing key fields
     7. Drop Duplicate rows based on MATRIX_MATCH_KEYS
+    8. Store low-cardinality text columns as categoricals
 
     Args:
         raw_df:
@@ -272,60 +397,78 @@ def clean_matrix(
     
     """
 
-    # Work on a copy so we don't mutate the original loaded DataFrame
-    df = raw_df.copy()
-
-    # 1) Rename raw columns -> canonical names
-    df = df.rename(columns=MATRIX_COLUMN_MAP)
+    # No upfront raw_df.copy(): with Copy-on-Write the select/filter steps
+    # below share the raw column data, and each cleaned column is a new
+    # array, so the loaded DataFrame is never mutated and columns outside
+    # MATRIX_CORE_COLUMNS are never copied.
 
-    # 2) Keep only the core columns we care about
-    df = _drop_unneeded_columns(df, MATRIX_CORE_COLUMNS)
+    # 1) + 2) Rename raw columns -> canonical names, keeping only the core
+    #    columns we care about (projected first, so the rest are never renamed)
+    df = _select_core_columns(raw_df, MATRIX_COLUMN_MAP, MATRIX_CORE_COLUMNS)
 
     # 3) Filter out unwanted accounts and transaction types
 
     # Ignore specific Matrix accounts entirely
-    # mask_bad_acct receives a Series (vector of 1 column)
+    # mask_bad_acct receives a bool ndarray (one entry per row)
     if "matrix_account" in df.columns:
-        # Assigns True if values are in IGNORED_MATRIX_ACCOUNTS (if any)
-        mask_bad_acct = df["matrix_account"].astype(str).isin(IGNORED_MATRIX_ACCOUNTS) # .isin() checks each row of the Series 
-    else:                                                                              # in the given Set or List.
-        # Creates a Series and assigns False to all rows (as a Series = 1 Column)
-        mask_bad_acct = pd.Series(False, index=df.index) # df.index represents all rows in the DataFrame
+        # Matrix account: values kept as exported, as text categories (a few dozen
+        #   accounts per export; only the distinct accounts are converted to text).
+        #   True where the account is in IGNORED_MATRIX_ACCOUNTS (if any)
+        df["matrix_account"] = _normalize_as_category(
+            df["matrix_account"],
+            lambda accounts: accounts.astype("string"),
+        )
+        mask_bad_acct = _ignored_category_mask(df["matrix_account"], IGNORED_MATRIX_ACCOUNTS)
+    else:
+        # All rows False (len(df.index) = number of rows in the DataFrame)
+        mask_bad_acct = np.zeros(len(df.index), dtype=bool)
 
 
     # Ignore rows where Transaction Type is in the excluded Set or List
     if "txn_method" in df.columns:
-        # method_lower gets assigned a Series of 'tax_method' values in lower case
-        method_lower = df["txn_method"].astype(str).str.strip().str.lower() # normalize before comparing
-        mask_bad_method = method_lower.isin(IGNORED_TXN_METHODS)
+        # Transaction method (ACH / Wire / Check) is normalized here, once per
+        #   distinct value, and the filter tests the stripped categories
+        #   (lowercased) rather than re-stripping the column; step 4 keeps the result
+        df["txn_method"] = _normalize_as_category(df["txn_method"], normalize_text_series)
+        mask_bad_method = _ignored_category_mask(df["txn_method"], IGNORED_TXN_METHODS, lower=True)
     else:
-        mask_bad_method = pd.Series(False, index=df.index)
+        mask_bad_method = np.zeros(len(df.index), dtype=bool)
 
 
-    # mask_bad_acct and mask_bad_method both are pandas Series of booleans indexed like df
-    # '|' in pandas is OR (logical computation) and will compare each row of the two Series
+    # mask_bad_acct and mask_bad_method both are bool arrays aligned with df's rows
+    # '|' is OR (logical computation) and will compare each row of the two arrays
     #   e.g.: T OR F = T ; F OR F =  F
     #
-    # A Series of True or False will be assigned to mask_drop indexed like df
-    mask_drop = mask_bad_acct | mask_bad_method
+    # An array of True or False will be assigned to mask_drop aligned with df's rows
+    #   (written into mask_bad_acct's buffer, which this step owns: no new array)
+    mask_drop = np.logical_or(mask_bad_acct, mask_bad_method, out=mask_bad_acct)
 
-    # ~ is the bitwise NOT operator for boolean Series, it flips True <-> False,
-    #  so for mask_drop: [False, True, True]
-    #        ~mask_drop: [True, False, False]
-    #
-    # df[~mask_drop] us boolean indexing in pandas, so keep the rows where mask_drop is false (converted to True), meaning
-    #   rows that are not bad (not included on the two Lists or Sets above).
-    df = df[~mask_drop].copy() # create a new DataFrame
+    # Keep the rows where mask_drop is False, meaning rows that are not bad (not
+    #   included on the two Lists or Sets above). np.flatnonzero turns the flipped
+    #   mask into row positions once, and .iloc takes them positionally, skipping
+    #   pandas' boolean-indexer checks. When nothing is dropped the frame is kept
+    #   as is, with no row take at all.
+    if mask_drop.any():
+        keep_rows = np.flatnonzero(np.logical_not(mask_drop, out=mask_drop))
+        df = df.iloc[keep_rows]    # new DataFrame (Copy-on-Write: no defensive .copy() needed)
 
 
     # 4) Clean fields
 
+    # Dates first: the optional transaction-date filter (step 5) then drops
+    #   out-of-window rows before any other column is cleaned, as a query
+    #   planner would push the predicate down
+    if "txn_date" in df.columns:
+        df["txn_date"] = to_date_series(df["txn_date"]) # function takes a Series df[...] directly
+        # 5) Optional date filtering on transaction date
+        df = apply_date_filter(df, "txn_date", date_filter=date_filter)
+
     if "plan_id" in df.columns:
         df["plan_id"] = normalize_plan_id_series(df["plan_id"])
 
     # SSN
     if "ssn" in df.columns:
-        df["ssn"] = normalize_ssn_series(df["ssn"]) # .apply() applies function to all values in Series df[...]
+        df["ssn"] = normalize_ssn_series(df["ssn"]) # column-wide, no per-row .apply(); string work runs once per distinct raw SSN
         invalid_mask = df["ssn"].isna() | (df["ssn"].str.len() != 9)
         invalid_count = int(invalid_mask.sum())
         if invalid_count > 0:
@@ -334,12 +477,6 @@ def clean_matrix(
                 stacklevel=2,
             )
     
-    # Dates
-    if "txn_date" in df.columns:
-        df["txn_date"] = to_date_series(df["txn_date"]) # function takes a Series df[...] directly
-        # 4.5) Optional date filtering on transaction date
-        df = apply_date_filter(df, "txn_date", date_filter=date_filter)
-    
     # Amounts
     if "gross_amt" in df.columns:
         df["gross_amt"] = to_numeric_series(df["gross_amt"])
@@ -354,15 +491,15 @@ def clean_matrix(
 
     # State
     if "state" in df.columns:
-        df["state"] = normalize_state_series(df["state"])
+        df["state"] = _normalize_as_category(df["state"], normalize_state_series)
     
     # Tax codes: extract primary code character (e.g. '7', 'G')
     for col in ["tax_code_1", "tax_code_2"]:
         if col in df.columns:
             df[col] = normalize_tax_code_series(df[col])
-            lengths = df[col].str.len()
-            invalid_tax = df[col].notna() & lengths.gt(2)
-            invalid_tax_count = int(invalid_tax.sum())
+            # <NA> codes have <NA> length, which .gt() keeps as <NA> and .sum() skips,
+            #   so no separate notna() pass is needed.
+            invalid_tax_count = int(df[col].str.len().gt(2).sum())
             if invalid_tax_count > 0:
                 warnings.warn(
                     f"Matrix tax code normalization produced {invalid_tax_count} values longer than 2 characters.",
@@ -371,33 +508,28 @@ def clean_matrix(
 
     # Transaction IDs: extract transaction id from float format (e.g. 44324566.0 -> '44324566')
     if "transaction_id" in df.columns:
-        df["transaction_id"] = df["transaction_id"].apply(_normalize_transaction_id)
+        df["transaction_id"] = _normalize_transaction_id_series(df["transaction_id"])
     
-    # Transaction method (ACH / Wire / Check)
-    if "txn_method" in df.columns:
-        df["txn_method"] = normalize_text_series(df["txn_method"], strip=True, upper=False)
-
-    # Tax form and federal taxing method (kept as normalized text)
+    # Tax form and federal taxing method (kept as normalized text categories)
     if "tax_form" in df.columns:
-        df["tax_form"] = normalize_text_series(df["tax_form"], strip=True, upper=False)
+        df["tax_form"] = _normalize_as_category(df["tax_form"], normalize_text_series)
 
     if "federal_taxing_method" in df.columns:
-        df["federal_taxing_method"] = normalize_text_series(
+        df["federal_taxing_method"] = _normalize_as_category(
             df["federal_taxing_method"],
-            strip=True,
-            upper=False,
+            normalize_text_series,
         )
     
     # Distribution type (Matrix perspective - keep raw but cleaned)
     if "dist_type" in df.columns:
-        df["dist_type"] = normalize_text_series(df["dist_type"], strip=True, upper=False)
+        df["dist_type"] = _normalize_as_category(df["dist_type"], normalize_text_series)
     
-    # Convenience: participant name normalized
+    # Convenience: participant name normalized (once per distinct name; a
+    #   participant usually has several distribution rows)
     if "participant_name" in df.columns:
-        df["participant_name"] = normalize_text_series(
+        df["participant_name"] = _normalize_distinct(
             df["participant_name"],
-            strip=True,
-            upper=False,
+            lambda names: normalize_text_series(names, strip=True, upper=False),
         )
 
     # Validation flags and issues
@@ -440,23 +572,123 @@ def clean_matrix(
     )
     
     
-    # 5) Optionally drop rows missing key fields for matching
+    # 5) + 6) Drop duplicate rows based on match keys and, optionally, rows
+    #    missing key fields for matching, in a single row take
     match_key_cols = [c for c in MATRIX_MATCH_KEYS if c in df.columns]
-    if drop_rows_missing_keys and match_key_cols:
-        df = df.dropna(subset=match_key_cols, how="any") # Drops rows where the value has NaN/NA in 'any' of those key columns, when
-                                                         #  how='all' drops only when 'all' of the columns have NaN/NA.
-                                                         # 
-                                                         # By default .dropna(axis=0) to drop rows but you can use
-                                                         #  axis=1 to drop columns
-    
-
-    # 6) Drop duplicate rows based on match keys
     if match_key_cols:
-        df = df.drop_duplicates(subset=match_key_cols, keep="first") # Drops duplicate rows based only by the match_key_cols
-                                                                     # Keep only the first row
-                                                                     # .drop_duplicates() only works on rows not on columns
-                                                                     #   a trick is to transpose from columns to rows,
-                                                                     #   df.T swaps rows & columns (rows become columns), and then
-                                                                     #   we can use df.T.drop_duplicates().T, .T at the end to transpose again
+        keep_rows = _first_row_positions(df, match_key_cols)        # First row of each distinct key (same rows as
+                                                                     #   .drop_duplicates(subset=match_key_cols, keep="first"),
+                                                                     #   found from exact factorize codes, no row hashing)
+        if drop_rows_missing_keys:
+            # Missing values compare equal in the dedupe, so a key with NA in any
+            #   column is NA on every row of its group: checking just the first
+            #   rows gives the same result as .dropna(subset=...) before deduping.
+            complete = df[match_key_cols].iloc[keep_rows].notna().all(axis=1).to_numpy()
+            keep_rows = keep_rows[complete]
+        df = df.iloc[keep_rows]
+
+    # 7) Drop categories whose rows were all filtered/deduplicated away above
+    for col in _MATRIX_CATEGORY_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].cat.remove_unused_categories()
+
+    # Tell downstream engines tax codes are already normalized (step 4), so
+    # they can skip their defensive re-normalization pass.
+    df.attrs["tax_codes_normalized"] = True
 
     return df
+
+
+def clean_matrix_chunks(
+        chunks: Iterable[pd.DataFrame],
+        drop_rows_missing_keys: bool = True,
+        date_filter: DateFilterConfig | None = None,
+) -> Iterator[pd.DataFrame]:
+
+    """
+
+    Clean a Matrix export that arrives in pieces, one chunk at a time.
+
+    Each raw chunk (e.g. from pd.read_csv(..., chunksize=...)) goes through
+    clean_matrix, so only one raw chunk is held in memory at a time. Match
+    keys already yielded by an earlier chunk are dropped from later ones, so
+    concatenating the yielded frames gives the same rows as clean_matrix on
+    the whole export.
+
+    Args:
+        chunks:
+            Iterable of raw Matrix DataFrames with the export's column names.
+        drop_rows_missing_keys:
+            Passed through to clean_matrix.
+        date_filter:
+            Passed through to clean_matrix.
+
+    Yields:
+        Cleaned DataFrames, one per raw chunk (possibly empty). Categorical
+        columns carry only each chunk's own categories.
+
+    """
+
+    # Exact key tuples (not row hashes), so distinct keys never collide
+    seen_keys: set[tuple] = set()
+    for raw_chunk in chunks:
+        df = clean_matrix(
+            raw_chunk,
+            drop_rows_missing_keys=drop_rows_missing_keys,
+            date_filter=date_filter,
+        )
+        match_key_cols = [c for c in MATRIX_MATCH_KEYS if c in df.columns]
+        if match_key_cols:
+            # Keys are already unique within the cleaned chunk (step 6). Missing
+            #   values become None first: a float NaN never equals itself, so it
+            #   would never be found in seen_keys, while the in-chunk dedupe
+            #   treats missing values as equal.
+            key_frame = df[match_key_cols]
+            key_frame = key_frame.astype(object).where(key_frame.notna(), None)
+            keys = list(key_frame.itertuples(index=False, name=None))
+            is_new = np.fromiter((key not in seen_keys for key in keys), dtype=bool, count=len(keys))
+            df = df.iloc[np.flatnonzero(is_new)]
+            seen_keys.update(key for key, new in zip(keys, is_new) if new)
+        yield df
+
+
+def load_clean_matrix(
+        path: Path | None = None,
+        use_sample_if_none: bool | None = None,
+        sheet_name: str | int = 0,
+        use_cache: bool = False,
+        drop_rows_missing_keys: bool = True,
+        date_filter: DateFilterConfig | None = None,
+) -> pd.DataFrame:
+
+    """
+
+    Load and clean the Matrix export in one step.
+
+    With use_cache=True the cleaned frame itself is pickled in CACHE_DIR,
+    keyed by the source file's path, mtime and size, CLEANING_CACHE_VERSION,
+    drop_rows_missing_keys and the resolved date filter (date_filter, or
+    DATE_FILTER_CONFIG when None), so repeated reconciliation runs skip the
+    Excel parse and every cleaning step until the export, the cleaning rules
+    or the reporting window change.
+
+    """
+
+    path = resolve_matrix_path(path, use_sample_if_none)
+
+    return cached_frame(
+        path,
+        sheet_name,
+        "matrix_clean",
+        lambda: clean_matrix(
+            load_matrix_excel(path, sheet_name=sheet_name),
+            drop_rows_missing_keys=drop_rows_missing_keys,
+            date_filter=date_filter,
+        ),
+        use_cache=use_cache,
+        cache_key=(
+            CLEANING_CACHE_VERSION,
+            drop_rows_missing_keys,
+            normalize_date_filter_config(date_filter),
+        ),
+    )
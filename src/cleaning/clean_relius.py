@@ -113,6 +113,9 @@ from ..config import (
     RELIUS_MATCH_KEYS,
 )
 from ..core.normalizers import (
+    _first_row_positions,
+    _map_distinct,
+    _normalize_distinct,
     apply_date_filter,
     normalize_plan_id_series,
     normalize_ssn_series,
@@ -140,15 +143,16 @@ def _drop_unneeded_columns(df: pd.DataFrame, keep: Iterable[str]) -> pd.DataFram
     
     Keep only specified columns (ignore others).
 
-    Returns a shallow copy with just the desired columns.
+    Returns a new frame with just the desired columns.
     
     """
     # df.columns = Index of column names in te DataFrame (iterable object)
     cols = [c for c in keep if c in df.columns] #List comprehension
 
     # df[cols] = Select only those columns
-    # .copy() return a new DataFrame, not a view.
-    return df[cols].copy()
+    # No .copy(): with Copy-on-Write the selection shares the column data
+    #   until a column is modified, and modifying it never touches df.
+    return df[cols]
 
 
 
@@ -233,17 +237,24 @@ def clean_relius(
         
     """
 
-    # Work on a copy so we don't mutate the original loaded DataFrame
-    df = raw_df.copy()
+    # No upfront raw_df.copy(): under Copy-on-Write the steps below never
+    # mutate the loaded DataFrame, and unneeded columns are never copied.
 
     # 1) Rename raw columns -> canonical names
-    df = df.rename(columns=RELIUS_COLUMN_MAP)
+    df = raw_df.rename(columns=RELIUS_COLUMN_MAP)
 
     # 2) Keep only the core columns we care about
     df = _drop_unneeded_columns(df, RELIUS_CORE_COLUMNS)
 
     # 3) Clean fields
 
+    # Dates first, so the optional export-date filter drops out-of-window
+    #   rows before the other columns are cleaned
+    if "exported_date" in df.columns:
+        df["exported_date"] = to_date_series(df["exported_date"]) # Returns datetime64[ns] dates (midnight) or NaT
+        # 3.5) Optional date filtering on export date
+        df = apply_date_filter(df, "exported_date", date_filter=date_filter)
+
     if "plan_id" in df.columns:
         df["plan_id"] = normalize_plan_id_series(df["plan_id"])
 
@@ -259,12 +270,6 @@ def clean_relius(
                 stacklevel=2,
             )
     
-    # Dates
-    if "exported_date" in df.columns:
-        df["exported_date"] = to_date_series(df["exported_date"]) # Returns either Series of datetime.date or NaT
-        # 3.5) Optional date filtering on export date
-        df = apply_date_filter(df, "exported_date", date_filter=date_filter)
-
     # Tax year
     if "tax_year" in df.columns:
         # Convert to number, if invalid -> NaN
@@ -277,7 +282,11 @@ def clean_relius(
 
     # distribution code (Relius perspective)
     if "dist_code_1" in df.columns:
-        df["dist_code_1"] = normalize_text_series(df["dist_code_1"], strip=True, upper=True)
+        # A small set of codes: normalized once per distinct raw value
+        df["dist_code_1"] = _normalize_distinct(
+            df["dist_code_1"],
+            lambda codes: normalize_text_series(codes, strip=True, upper=True),
+        )
         lengths = df["dist_code_1"].str.len()
         invalid_tax = df["dist_code_1"].notna() & lengths.gt(2)
         invalid_tax_count = int(invalid_tax.sum())
@@ -289,16 +298,25 @@ def clean_relius(
 
     # Distribution name -> category
     if "dist_name" in df.columns:
-        # Apply _classify_relius_dist_type  to each value in the 'dist_name' column
+        # Apply _classify_relius_dist_type once per distinct 'dist_name' value (a few
+        #   dozen plan distribution names) and broadcast it to every row; missing -> 'other'
         # Store normalized category in new column 'dist_category_relius'
-        df["dist_category_relius"] = df["dist_name"].apply(_classify_relius_dist_type)
+        df["dist_category_relius"] = _map_distinct(
+            df["dist_name"], _classify_relius_dist_type, na_value="other"
+        ).astype("string")
+
+    # Descriptive text kept as exported, stored as pandas string dtype like the
+    #   cleaned text columns instead of the raw object columns
+    for col in ("first_name", "last_name", "state", "dist_name"):
+        if col in df.columns:
+            df[col] = df[col].astype("string")
 
     # Full name (for matching Matrix and reporting)
     if "first_name" in df.columns and "last_name" in df.columns:
         df["full_name"] = (
-            normalize_text_series(df["first_name"], strip=True, upper=False).fillna("")
+            _normalize_distinct(df["first_name"], normalize_text_series).fillna("")
             + " "
-            + normalize_text_series(df["last_name"], strip=True, upper=False).fillna("")
+            + _normalize_distinct(df["last_name"], normalize_text_series).fillna("")
         ).str.strip().replace("", pd.NA) # removes leading/trailing spaces in case one side was empty
 
     # Validation flags and issues
@@ -334,16 +352,17 @@ def clean_relius(
         code_1099r_valid,
     )
     
-    # 4) Optionally drop rows missing key fields for matching
+    # 4) + 5) Drop duplicate rows based on match keys and, optionally, rows
+    #    missing key fields for matching, in a single row take
     match_key_cols = [c for c in RELIUS_MATCH_KEYS if c in df.columns]
-    if drop_rows_missing_keys and match_key_cols:
-        # Drops any row that has NaN/NA in an of those key columns
-        df = df.dropna(subset=match_key_cols, how="any")
-
-    
-    # 5) Drop duplicate rows based on match keys
     if match_key_cols:
         # If multiple rows have the same values in all match key columns, only keep the first
-        df = df.drop_duplicates(subset=match_key_cols, keep="first")
+        keep_rows = _first_row_positions(df, match_key_cols)
+        if drop_rows_missing_keys:
+            # Drops any key that has NaN/NA in any of those key columns (the whole
+            #   duplicate group shares it, so checking first rows is enough)
+            complete = df[match_key_cols].iloc[keep_rows].notna().all(axis=1).to_numpy()
+            keep_rows = keep_rows[complete]
+        df = df.iloc[keep_rows]
     
     return df
@@ -30,6 +30,8 @@ Expected output schema (canonical)
 Public API
 ----------
 - clean_relius_demo(raw_df: pd.DataFrame) -> pd.DataFrame
+- load_clean_relius_demo(path=None, use_sample_if_none=None, sheet_name=0,
+  use_cache=False) -> pd.DataFrame
 
 Privacy / compliance note
 -------------------------
@@ -41,10 +43,16 @@ production version only in secure environments with proper access controls.
 from __future__ import annotations
 
 import warnings
+from pathlib import Path
 
 import pandas as pd
 
-from ..config import RELIUS_DEMO_COLUMN_MAP
+from ..config import CLEANING_CACHE_VERSION, RELIUS_DEMO_COLUMN_MAP
+from ..core.load_data import (
+    cached_frame,
+    load_relius_demo_excel,
+    resolve_relius_demo_path,
+)
 from ..core.normalizers import (
     normalize_plan_id_series,
     normalize_ssn_series,
@@ -75,19 +83,19 @@ def clean_relius_demo(raw_df: pd.DataFrame) -> pd.DataFrame:
 
     """
 
-    df_raw = raw_df.copy()
-
     # Standardize column names so the mapping works robustly
-    df_raw.columns = [c.strip().upper() for c in df_raw.columns]
+    # (normalized header -> raw header, so only mapped columns get copied)
+    source_cols = {c.strip().upper(): c for c in raw_df.columns}
 
     # Verify required columns exist
     required = list(RELIUS_DEMO_COLUMN_MAP.keys())
-    missing = [c for c in required if c not in df_raw.columns]
+    missing = [c for c in required if c not in source_cols]
     if missing:
         raise ValueError(f"Missing expected columns in Relius demo file: {missing}")
 
     # Keep only mapped columns
-    df = df_raw[required].copy()
+    df = raw_df[[source_cols[c] for c in required]]
+    df.columns = required
 
     # Rename to canonical names
     df = df.rename(columns=RELIUS_DEMO_COLUMN_MAP)
@@ -102,7 +110,9 @@ def clean_relius_demo(raw_df: pd.DataFrame) -> pd.DataFrame:
             stacklevel=2,
         )
 
-    # Normalize DOB and term_date to date objects
+    # Normalize DOB and term_date to midnight datetime64 (NaT when missing),
+    # like every other cleaned date; engines work on datetime64 directly, so
+    # no per-row date objects are created.
     df["dob"] = to_date_series(df["dob"])
     df["term_date"] = to_date_series(df["term_date"])
 
@@ -135,12 +145,40 @@ def clean_relius_demo(raw_df: pd.DataFrame) -> pd.DataFrame:
         code_1099r_valid,
     )
 
-    # Drop rows with no usable SSN
-    df = df[df["ssn"].notna()].copy()
-
-    # If there are duplicates for the same (plan_id, ssn), keep the last
-    df = (
-        df.sort_values(["plan_id", "ssn"]).drop_duplicates(["plan_id", "ssn"], keep="last")
-    )
+    # Drop rows with no usable SSN and, if there are duplicates for the same
+    # (plan_id, ssn), keep the last one in file order. A single boolean mask
+    # avoids sorting (and moving) every column just to pick one row per key.
+    keep_mask = df["ssn"].notna() & ~df.duplicated(["plan_id", "ssn"], keep="last")
+    df = df[keep_mask]
 
     return df
+
+
+def load_clean_relius_demo(
+        path: Path | None = None,
+        use_sample_if_none: bool | None = None,
+        sheet_name: str | int = 0,
+        use_cache: bool = False,
+) -> pd.DataFrame:
+
+    """
+
+    Load and clean the Relius demo export in one step.
+
+    With use_cache=True the cleaned frame itself is pickled in CACHE_DIR,
+    keyed by the source file's path, mtime and size and by
+    CLEANING_CACHE_VERSION, so repeated engine runs skip the Excel parse, SSN
+    normalization and dedupe until the export or the cleaning rules change.
+
+    """
+
+    path = resolve_relius_demo_path(path, use_sample_if_none)
+
+    return cached_frame(
+        path,
+        sheet_name,
+        "relius_demo_clean",
+        lambda: clean_relius_demo(load_relius_demo_excel(path, sheet_name=sheet_name)),
+        use_cache=use_cache,
+        cache_key=(CLEANING_CACHE_VERSION,),
+    )
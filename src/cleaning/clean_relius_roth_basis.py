@@ -59,12 +59,14 @@ from __future__ import annotations
 from typing import Iterable
 import warnings
 
+import numpy as np
 import pandas as pd
 from ..config import (
     RELIUS_ROTH_BASIS_COLUMN_MAP,
     RELIUS_ROTH_BASIS_CORE_COLUMNS,
 )
 from ..core.normalizers import (
+    _first_row_positions,
     normalize_plan_id_series,
     normalize_ssn_series,
     normalize_text_series,
@@ -81,10 +83,10 @@ from ..core.validators import (
 
 def _drop_unneeded_columns(df: pd.DataFrame, keep: Iterable[str]) -> pd.DataFrame:
 
-    """Return a copy with only the requested columns (ignore extras)."""
+    """Return only the requested columns (ignore extras); no copy under Copy-on-Write."""
 
     cols = [c for c in keep if c in df.columns]
-    return df[cols].copy()
+    return df[cols]
 
 
 # --- Main cleaning function ------------------------------------------------------
@@ -101,10 +103,9 @@ def clean_relius_roth_basis(raw_df: pd.DataFrame) -> pd.DataFrame:
     4) Deduplicate on (plan_id, ssn) favoring rows with non-null year/basis.
     """
     
-    df = raw_df.copy()
-
-    # 1) Standardize column names
-    df = df.rename(columns=RELIUS_ROTH_BASIS_COLUMN_MAP)
+    # 1) Standardize column names (no upfront copy: Copy-on-Write keeps
+    #    raw_df untouched by the assignments below)
+    df = raw_df.rename(columns=RELIUS_ROTH_BASIS_COLUMN_MAP)
 
     # 2) Keep only the core Roth basis columns
     df = _drop_unneeded_columns(df, RELIUS_ROTH_BASIS_CORE_COLUMNS)
@@ -164,11 +165,12 @@ def clean_relius_roth_basis(raw_df: pd.DataFrame) -> pd.DataFrame:
     # 4) Deduplicate by identifiers, keeping the row with the most non-null signals
     if {"plan_id", "ssn"} <= set(df.columns):
         completeness_cols = ["first_roth_tax_year", "roth_basis_amt"]
-        df["__completeness__"] = df[completeness_cols].notna().sum(axis=1)
-        df = (
-            df.sort_values("__completeness__", ascending=False)
-            .drop_duplicates(subset=["plan_id", "ssn"], keep="first")
-            .drop(columns="__completeness__")
-        )
+        completeness = df[completeness_cols].notna().sum(axis=1).to_numpy()
+        # Most complete rows first (stable: file order breaks ties). Only the
+        # two key columns are reordered to find each key's first row; exact
+        # factorize codes, no row hashing, and the full frame is taken once.
+        order = np.argsort(-completeness, kind="stable")
+        keys = df[["plan_id", "ssn"]].iloc[order]
+        df = df.iloc[order[_first_row_positions(keys, ["plan_id", "ssn"])]]
 
     return df
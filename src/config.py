@@ -98,6 +98,10 @@ DATA_DIR = BASE_DIR / "data"
 SAMPLE_DIR = DATA_DIR / "sample"
 RAW_DATA_DIR = DATA_DIR / "raw"
 PROCESSED_DATA_DIR = DATA_DIR / "processed"
+CACHE_DIR = PROCESSED_DATA_DIR / "cache"   # local-only parsed-export cache (gitignored)
+# Version of the cleaning rules baked into cached *cleaned* frames. Bump it
+# whenever a cleaner's output changes, so stale cached frames are rebuilt.
+CLEANING_CACHE_VERSION = 2
 
 REPORTS_DIR = BASE_DIR / "reports"
 REPORTS_FIGURES_DIR = REPORTS_DIR / "figures"
@@ -146,6 +150,7 @@ for _path in [
     SAMPLE_DIR,
     RAW_DATA_DIR,
     PROCESSED_DATA_DIR,
+    CACHE_DIR,
     REPORTS_DIR,
     REPORTS_FIGURES_DIR,
     REPORTS_SAMPLES_DIR,
@@ -372,11 +377,12 @@ MATRIX_MATCH_KEYS = [
 # --- Business rules (plan-specific 1099 code logic) ---------------------------
 
 # Inherited plan IDs that have special 1099-R code handling.
-INHERITED_PLAN_IDS = {
+# frozenset: immutable, and the hash set is built once for every .isin lookup.
+INHERITED_PLAN_IDS = frozenset({
     "300004PLAT",
     "300004MBD",
     "300004MBDII",
-}
+})
 
 # Default plan scope for Engine A reconciliation (used when plan_ids is not provided).
 DEFAULT_RECONCILIATION_PLAN_IDS = INHERITED_PLAN_IDS
@@ -464,10 +470,10 @@ class AgeTaxCodeConfig:
 
     # Codes that should be excluded from age-based logic
     # (rollovers from traditional and Roth plans, etc.)
-    excluded_codes: tuple[str, ...] = ("G", "H", "11", "13",
-                                       "15", "16", "17", "18",
-                                       "19", "33", "4",
-                                    )
+    excluded_codes: frozenset[str] = frozenset({"G", "H", "11", "13",
+                                                "15", "16", "17", "18",
+                                                "19", "33", "4",
+                                                })
 
 
 @dataclass(frozen=True)
@@ -500,7 +506,7 @@ class RothTaxCodeConfig:
     Configuration for Roth tax-code handling (Engine C).
     """
 
-    excluded_codes_taxcode: tuple[str, ...] = (
+    excluded_codes_taxcode: frozenset[str] = frozenset({
         "11",
         "13",
         "15",
@@ -509,7 +515,7 @@ class RothTaxCodeConfig:
         "18",
         "19",
         "33",
-    )
+    })
     status_excluded: str = "excluded_from_age_engine_rollover_or_inherited"
     action_update: str = "UPDATE_1099"
     action_investigate: str = "INVESTIGATE"
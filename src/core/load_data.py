@@ -15,6 +15,8 @@ Design goals
 - Repeatability: ensure the same input file reads consistently across environments.
 - Flexibility: allow configuration of sheet name, header row, and dtype rules when needed.
 - Compatibility: return raw DataFrames ready to be passed into cleaning modules.
+- Speed: optionally reuse a local pickle of a parsed export (keyed by file
+  mtime + size) so repeated notebook runs skip the openpyxl parse.
 
 Inputs
 ------
@@ -53,10 +55,17 @@ Public API
 - load_matrix_excel(path: str | Path, sheet_name=0, header=0, dtype=str) -> pd.DataFrame
 - load_relius_excel(path: str | Path, sheet_name=0, header=0, dtype=str) -> pd.DataFrame
 - load_relius_roth_basis_excel(path: str | Path, sheet_name=0, header=0, dtype=str) -> pd.DataFrame
+- cached_frame(path, sheet_name, cache_tag, build, use_cache=False, cache_key=())
+  returns a frame derived from a source file through the CACHE_DIR pickle cache
+  (used by the cleaned-frame loaders in src.cleaning).
+- resolve_matrix_path / resolve_relius_demo_path resolve a default export
+  path (sample or raw data) and check that it exists.
 
 Optional helpers
 ----------------
 - load_excel(path, ...) generic loader used by the two public functions.
+- _read_excel_cached(path, sheet_name, cache_tag, use_cache=False) reads an
+  export through that cache.
 
 Privacy / compliance note
 -------------------------
@@ -65,13 +74,17 @@ synthetic or masked. Production runs should read files from secure locations.
 """
 
 
+import hashlib
+import os
+import pickle
 from pathlib import Path
-from typing import Optional #For type hinting optional parameters | Describing the allowed types for an arg(variable)
+from typing import Callable, Hashable, Optional #For type hinting optional parameters | Describing the allowed types for an arg(variable)
 
 import pandas as pd #The main data manipulation library for data tables
 
 # Relative imports from the config module in the same package /src/core
 from ..config import (
+    CACHE_DIR,
     RAW_DATA_DIR,
     SAMPLE_DIR,
     USE_SAMPLE_DATA_DEFAULT,
@@ -116,6 +129,129 @@ def _validate_columns(df: pd.DataFrame, required_cols, source_name: str) -> None
 
 
 
+def cached_frame(
+        path: Path,
+        sheet_name: Optional[str],
+        cache_tag: str,
+        build: Callable[[], pd.DataFrame],
+        use_cache: bool = False,
+        cache_key: tuple[Hashable, ...] = (),
+) -> pd.DataFrame:
+
+    """
+
+    Return build(), optionally through a local pickle cache keyed by a source file.
+
+    The cache entry is keyed by the source file's resolved path, mtime and
+    size, so editing or replacing the export invalidates it automatically, and
+    by cache_key, the settings build() depends on (e.g. a cleaning version and
+    date filter), so changing those rebuilds it. Older entries for the same
+    file/sheet are removed when a new one is written. Entries are written to a
+    temp file and renamed into place, and an entry that cannot be unpickled is
+    rebuilt rather than raised.
+
+    Args:
+        path: Source file the cached frame is derived from.
+        sheet_name: Sheet name or index, used in the cache filename.
+        cache_tag: Producer label used in the cache filename (e.g. 'relius_demo').
+        build: Zero-argument callable producing the frame on a cache miss.
+        use_cache: If False, call build() directly (no cache I/O).
+        cache_key: Settings that change build()'s output; their repr is
+            hashed into the cache filename.
+
+    Returns:
+        pandas.DataFrame returned by build() (or its cached copy).
+
+    """
+
+    if not use_cache:
+        return build()
+
+    stat = path.stat()
+    path_digest = hashlib.blake2b(str(path.resolve()).encode(), digest_size=6).hexdigest()
+    key_digest = hashlib.blake2b(repr(cache_key).encode(), digest_size=6).hexdigest()
+    prefix = f"{cache_tag}_{path.stem}_{path_digest}_{sheet_name}_"
+    cache_path = CACHE_DIR / f"{prefix}{key_digest}_{stat.st_mtime_ns}_{stat.st_size}.pkl"
+    if cache_path.exists():
+        try:
+            return pd.read_pickle(cache_path)
+        except (EOFError, pickle.UnpicklingError, AttributeError, ImportError, ValueError):
+            # Truncated/corrupt entry (or one from an incompatible pandas) -> cache miss
+            cache_path.unlink(missing_ok=True)
+
+    df = build()
+
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    for stale in CACHE_DIR.glob(f"{prefix}*.pkl"):
+        stale.unlink(missing_ok=True)
+    # Write under a per-process temp name, then rename into place in one step,
+    #   so a killed run or two concurrent runs never leave a half-written entry.
+    tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        df.to_pickle(tmp_path)
+        os.replace(tmp_path, cache_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+    return df
+
+
+def _read_excel_cached(
+        path: Path,
+        sheet_name: Optional[str] = 0,
+        cache_tag: str = "excel",
+        use_cache: bool = False,
+        usecols=None,
+) -> pd.DataFrame:
+
+    """
+
+    Read an Excel sheet, optionally through the local pickle cache.
+
+    Args:
+        path: Excel file to read.
+        sheet_name: Sheet name or index to read.
+        cache_tag: Loader label used in the cache filename (e.g. 'relius_demo').
+        use_cache: If False, read the workbook directly (no cache I/O).
+        usecols: Optional column selector forwarded to pd.read_excel.
+
+    Returns:
+        pandas.DataFrame exactly as returned by pd.read_excel.
+
+    """
+
+    return cached_frame(
+        path,
+        sheet_name,
+        cache_tag,
+        lambda: pd.read_excel(path, sheet_name=sheet_name, usecols=usecols),
+        use_cache=use_cache,
+    )
+
+
+
+def resolve_relius_demo_path(
+        path: Optional[Path] = None,
+        use_sample_if_none: bool | None = None,
+) -> Path:
+    """Resolve the Relius demo export path (config default when None) and check it exists."""
+
+    if path is None:
+        if use_sample_if_none is None:
+            use_sample_if_none = USE_SAMPLE_DATA_DEFAULT
+        if use_sample_if_none:
+            path = SAMPLE_DIR / "relius_demo_sample.xlsx"
+        else:
+            path = RAW_DATA_DIR / "real_demo_relius_2025.xlsx"
+
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(f"Relius Demo Excel file not found at: {path}")
+
+    return path
+
+
+
 def load_relius_excel(
         path: Optional[Path] = None,           # Type hint: "Should be" either a Path object or None / Newer Python: path: Path | None = None
         use_sample_if_none: bool | None = None, # If path is None, use config default unless overridden
@@ -217,6 +353,7 @@ def load_relius_demo_excel(
         path: Optional[Path] = None,
         use_sample_if_none: bool | None = None,
         sheet_name: Optional[str] = 0,
+        use_cache: bool = False,
 ) -> pd.DataFrame:
 
     """
@@ -232,39 +369,63 @@ def load_relius_demo_excel(
             Override for USE_SAMPLE_DATA_DEFAULT when path is None.
         sheet_name:
             Sheet name or index to read (defaults to first sheet).
+        use_cache:
+            If True, reuse a pickled copy of the parsed sheet from CACHE_DIR
+            while the source file's mtime and size are unchanged.
 
     Returns:
         pandas.DataFrame with raw Relius demo data (no clearning/renaming yet).
 
     """
 
-    if path is None:
-        if use_sample_if_none is None:
-            use_sample_if_none = USE_SAMPLE_DATA_DEFAULT
-        if use_sample_if_none:
-            path = SAMPLE_DIR / "relius_demo_sample.xlsx"
-        else:
-            path = RAW_DATA_DIR / "real_demo_relius_2025.xlsx"
+    path = resolve_relius_demo_path(path, use_sample_if_none)
 
-    path = Path(path)
-    if not path.exists():
-        raise FileNotFoundError(f"Relius Demo Excel file not found at: {path}")
+    required_cols = list(RELIUS_DEMO_COLUMN_MAP.keys())
 
-    df = pd.read_excel(path, sheet_name=sheet_name)
+    # The participant master is wide; only parse the mapped columns
+    # (header match is case/whitespace-insensitive, like the rename below).
+    df = _read_excel_cached(
+        path,
+        sheet_name,
+        cache_tag="relius_demo",
+        use_cache=use_cache,
+        usecols=lambda col: str(col).strip().upper() in required_cols,
+    )
 
     # Normalize headers to handle whitespace/case variance before validation
     df.columns = [c.strip().upper() for c in df.columns]
 
-    required_cols = list(RELIUS_DEMO_COLUMN_MAP.keys())
     _validate_columns(df, required_cols, source_name="Relius Demo")
 
     return df
 
 
+def resolve_matrix_path(
+        path: Optional[Path] = None,
+        use_sample_if_none: bool | None = None,
+) -> Path:
+    """Resolve the Matrix export path (config default when None) and check it exists."""
+
+    if path is None:
+        if use_sample_if_none is None:
+            use_sample_if_none = USE_SAMPLE_DATA_DEFAULT
+        if use_sample_if_none:
+            path = SAMPLE_DIR / "matrix_sample.xlsx"
+        else:
+            path = RAW_DATA_DIR / "real_all_matrix_2025.xlsx"
+
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(f"Matrix Excel file not found at: {path}")
+
+    return path
+
+
 def load_matrix_excel(
         path: Optional[Path] = None,
         use_sample_if_none: bool | None = None,
         sheet_name: Optional[str] = 0,
+        use_cache: bool = False,
 ) -> pd.DataFrame:
     
     """
@@ -280,25 +441,18 @@ def load_matrix_excel(
             Override for USE_SAMPLE_DATA_DEFAULT when path is None.
         sheet_name:
             Sheet name or index to read (defaults to first sheet).
+        use_cache:
+            If True, reuse a pickled copy of the parsed sheet from CACHE_DIR
+            while the source file's mtime and size are unchanged.
 
     Returns:
         pandas.DataFrame with raw Relius data (no clearning/renaming yet).
 
     """
 
-    if path is None:
-        if use_sample_if_none is None:
-            use_sample_if_none = USE_SAMPLE_DATA_DEFAULT
-        if use_sample_if_none:
-            path = SAMPLE_DIR / "matrix_sample.xlsx"
-        else:
-            path = RAW_DATA_DIR / "real_all_matrix_2025.xlsx"
+    path = resolve_matrix_path(path, use_sample_if_none)
 
-    path = Path(path)
-    if not path.exists():
-        raise FileNotFoundError(f"Matrix Excel file not found at: {path}")
-    
-    df = pd.read_excel(path, sheet_name=sheet_name)
+    df = _read_excel_cached(path, sheet_name, cache_tag="matrix", use_cache=use_cache)
 
     required_cols = list(MATRIX_COLUMN_MAP.keys())
     _validate_columns(df, required_cols, source_name="Matrix")
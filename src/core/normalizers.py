@@ -14,7 +14,7 @@ Design goals
 ------------
 - Single source of truth for SSN, plan_id, date, numeric, tax code, and
   age-attainment handling.
-- Preserve canonical dtypes: pandas string for text, datetime.date for dates,
+- Preserve canonical dtypes: pandas string for text, datetime64[ns] (midnight) for dates,
   and pandas nullable integers where appropriate.
 - Keep behavior consistent with existing cleaners to avoid downstream
   regressions.
@@ -47,15 +47,62 @@ from numbers import Integral, Real       # Integral -> integer-like numeric type
                                          # Real -> real_valued numbers (floats and ints)
                                          # Use them to detect whether a value is an integer or float in a generic way
 
-from typing import Any                   # Type hint meaning "this can be anything"
+from typing import Any, Callable         # Any: "this can be anything"; Callable: function-typed arguments
 
+import numpy as np
 import pandas as pd
+from pandas.api.types import infer_dtype, is_bool_dtype, is_numeric_dtype
 import re                                # Python's built-in regular expression module
 
 from ..config import DateFilterConfig, IraRolloverConfig, RothTaxableConfig
 from .validators import normalize_date_filter_config
 
 
+_ISO_DATE_FORMAT = "%Y-%m-%d"
+
+# normalize_ssn() runs per value; compile its patterns once at import.
+_RE_FLOAT_TEXT = re.compile(r"^\d+\.0$")
+# Column-wide equivalent of both steps in one pass: a whole "<digits>.0" cell
+# keeps its digits (group 1); otherwise each non-digit matches the second
+# branch, where the unmatched group substitutes as "".
+_RE_SSN_STRIP = re.compile(r"^(\d+)\.0$|\D")
+# Leading 1-2 alphanumeric tax code characters (see _extract_tax_codes()).
+_RE_TAX_CODE = re.compile(r"^\s*([A-Za-z0-9]{1,2})")
+# Whitespace runs (and hyphens) for the compact/space-normalized text helpers.
+_RE_WHITESPACE = re.compile(r"\s+")
+_RE_WHITESPACE_OR_HYPHEN = re.compile(r"[\s-]+")
+
+
+class _KeepDigitsTable(dict):
+    """
+    str.translate() table that deletes every non-digit character.
+
+    Same result as re.sub(r"\\D", "", text), as a plain character scan
+    with no regex matching. ASCII is filled in up front; any other code point
+    is looked up once (kept if str.isdecimal(), the same class as \\d) and cached.
+    """
+
+    def __missing__(self, codepoint: int) -> int | None:
+        kept = codepoint if chr(codepoint).isdecimal() else None
+        self[codepoint] = kept
+        return kept
+
+
+_KEEP_DIGITS = _KeepDigitsTable({c: (c if 48 <= c <= 57 else None) for c in range(128)})
+
+
+def _digits_only(text: str) -> str:
+    """Drop every non-digit character from text ('123-45-6789' -> '123456789')."""
+    return text.translate(_KEEP_DIGITS)
+
+
+def _format_ssn_number(number: int) -> str | pd.NA:
+    """Zero-pad a whole number to 9 digits (123 -> '000000123'); negatives or more than 9 digits -> <NA>."""
+    if not 0 <= number < 10**9:
+        return pd.NA
+    return f"{number:09d}"
+
+
 def normalize_ssn(value: Any) -> str | pd.NA:                        # value can be anything(string, int, float, NaN, etc.)                             
     """Normalize SSN to a 9-digit string; return <NA> for
        invalid/unsafe inputs.
@@ -64,13 +111,13 @@ def normalize_ssn(value: Any) -> str | pd.NA:                        # value can
         return pd.NA
 
     if isinstance(value, Integral) and not isinstance(value, bool):  # isinstance() compares a value with the dtype -> True for Int, False for Floats or Strs
-        return f"{int(value):09d}"       # 'f' -> :09d: format to 9 digits, zero-padded to the left. e.g.: 123 -> '000000123'
+        return _format_ssn_number(int(value))
 
     if isinstance(value, Real) and not isinstance(value, Integral):  # compares if value is a float and not an integer
         if pd.isna(value):
             return pd.NA
         if value.is_integer():           # True if the float is like '123456789.0', false if 123.5, 123.1, etc. 
-            return f"{int(value):09d}"   # If it's an integer-ish float -> convert to int, zero-pad to 9 digits
+            return _format_ssn_number(int(value))
         return pd.NA
 
     value_str = str(value).strip()       # Convert any other type(string, object, etc.) to str, .strip() removes leading/tradiling whitespace
@@ -78,11 +125,11 @@ def normalize_ssn(value: Any) -> str | pd.NA:                        # value can
     # '^' start of the string -- '\d+' one or more digits -- '\.0' literally ".0" -- '$' end of the string
     # This matches strings like "123456789.0" -> if its a match strips off the final ".0"
     # Safety net for data that has been exported as strings but came from floats.
-    if re.match(r"^\d+\.0$", value_str):
+    if _RE_FLOAT_TEXT.match(value_str):
         value_str = value_str[:-2]
 
     # '\D' means any non-digit character -- replace all non-digits with "" -- e.g. "123-45-6789" -> "123456789"
-    digits = re.sub(r"\D", "", value_str)
+    digits = _digits_only(value_str)
     if not digits:
         return pd.NA
 
@@ -95,10 +142,160 @@ def normalize_ssn(value: Any) -> str | pd.NA:                        # value can
     return digits
 
 
+def _numeric_cell_mask(series: pd.Series) -> pd.Series:
+    """Flag cells holding real numbers (not bools) so they skip the text path."""
+    dtype = series.dtype
+    if is_bool_dtype(dtype):
+        return pd.Series(False, index=series.index)
+    if is_numeric_dtype(dtype):
+        return pd.Series(True, index=series.index)
+    if dtype != object:
+        return pd.Series(False, index=series.index)
+
+    inferred = infer_dtype(series, skipna=True)                   # Single C-level scan over the object array
+    if inferred in ("string", "empty"):
+        return pd.Series(False, index=series.index)
+    if inferred in ("integer", "floating", "mixed-integer-float", "decimal"):
+        return pd.Series(True, index=series.index)
+    # Mixed object column (e.g. Excel cells holding both 123456789 and "123-45-6789")
+    return series.map(lambda value: isinstance(value, Real) and not isinstance(value, bool))
+
+
+# Place values of a 9-digit SSN, most significant first.
+_SSN_PLACE_VALUES = 10 ** np.arange(8, -1, -1, dtype=np.int64)
+
+
+def _format_ssn_numbers(numbers: np.ndarray) -> np.ndarray:
+    """
+    Format whole numbers in [0, 10**9) as zero-padded 9-digit SSN strings.
+
+    Array-level equivalent of f"{n:09d}": each number's digits are written
+    into one row of a fixed-width (n, 9) ASCII byte buffer, which is read back
+    as 9-byte strings. No per-value str()/zfill() calls.
+    """
+    ascii_digits = (numbers[:, None] // _SSN_PLACE_VALUES % 10 + ord("0")).astype(np.uint8)
+    return ascii_digits.view("S9").ravel().astype("U9").astype(object)
+
+
+def _normalize_ssn_values(series: pd.Series) -> pd.Series:
+    """Column-wide SSN normalization; see normalize_ssn_series()."""
+    # Results are filled by position and wrapped with the original index once,
+    # so duplicate index labels (common after a concat or merge) are fine.
+    present = series.notna().to_numpy(dtype=bool)
+    numeric_mask = present & _numeric_cell_mask(series).to_numpy(dtype=bool)
+    text_mask = present & ~numeric_mask
+
+    ssns = np.full(len(series), pd.NA, dtype=object)
+
+    if numeric_mask.any():
+        positions = np.flatnonzero(numeric_mask)
+        numbers = pd.to_numeric(series.iloc[positions], errors="coerce").to_numpy(
+            dtype=np.float64, na_value=np.nan
+        )
+        # Whole numbers of at most 9 digits; anything else stays <NA>
+        keep = np.isfinite(numbers) & (numbers >= 0) & (numbers < 1e9)
+        keep[keep] = numbers[keep] % 1 == 0
+        ssns[positions[keep]] = _format_ssn_numbers(numbers[keep].astype(np.int64))
+
+    if text_mask.any():
+        positions = np.flatnonzero(text_mask)
+        text = series.iloc[positions].reset_index(drop=True).astype("string").str.strip()
+        # Fast path: cells that are already bare digits (the usual export
+        # shape) need no regex work; str.isdecimal is the same class as \d.
+        bare = text.str.isdecimal().to_numpy(dtype=bool)
+        if not bare.all():
+            # "123456789.0" -> "123456789", "123-45-6789" -> "123456789" (single regex pass)
+            text[~bare] = text[~bare].str.replace(_RE_SSN_STRIP, r"\1", regex=True)
+        # 1-9 digits are left-padded ("1234567" -> "001234567"); no digits or more
+        # than 9 -> <NA>. One length pass decides both.
+        lengths = text.str.len()
+        ssns[positions] = (
+            text.where(lengths.ge(1) & lengths.le(9)).str.zfill(9).to_numpy(dtype=object)
+        )
+
+    return pd.Series(pd.array(ssns, dtype="string"), index=series.index)
+
+
 def normalize_ssn_series(series: pd.Series) -> pd.Series:
-    """Vectorized SSN normalization with pandas string dtype."""
-    return series.map(normalize_ssn).astype("string")             # .map() applies normalize_ssn element-by-element to the Series. Returns normalized Series
-                                                                  # .astype("string") converts to pandas' string dtype
+    """Vectorized SSN normalization with pandas string dtype.
+
+    Mirrors normalize_ssn() with column-wide string operations instead of a
+    per-row Python call: numeric cells must be whole numbers, text cells drop
+    an Excel-style trailing ".0" and every non-digit, short values are
+    left-padded to 9 digits, and anything that is not 9 digits becomes <NA>.
+
+    A participant usually has many distribution rows, so the string work runs
+    once per distinct raw value and is broadcast back through factorize codes.
+    """
+    return _normalize_distinct(series, _normalize_ssn_values)
+
+
+def _normalize_distinct(
+        series: pd.Series,
+        normalize: Callable[[pd.Series], pd.Series],
+) -> pd.Series:
+    """
+    Run a column normalizer on the distinct raw values only.
+
+    For columns whose values repeat (SSNs, names, codes): the column is
+    factorized once, normalize() runs on the distinct values, and its result
+    is broadcast back through the factorize codes (missing -> <NA>). An
+    all-distinct column is normalized directly, skipping the take.
+    normalize() must return an extension-array-backed Series (e.g. "string").
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        series = series.astype(object)
+
+    codes, uniques = pd.factorize(series)
+    if len(uniques) == len(series):
+        return normalize(series)
+
+    normalized = normalize(pd.Series(uniques)).array
+    return pd.Series(
+        normalized.take(codes, allow_fill=True),                  # code -1 (missing) -> <NA>
+        index=series.index,
+    )
+
+
+def _map_distinct(series: pd.Series, func, na_value: Any) -> pd.Series:
+    """
+    Series.map(func) for a low-cardinality column, calling func once per
+    distinct value.
+
+    The column is factorized once, func runs on the distinct values only, and
+    the results are broadcast back to rows by factorize code; missing values
+    map to na_value. Returns an object Series aligned with series.
+    """
+    codes, uniques = pd.factorize(series)
+    mapped = np.empty(len(uniques) + 1, dtype=object)
+    mapped[:-1] = [func(value) for value in uniques]
+    mapped[-1] = na_value                                         # code -1 (missing) indexes it
+    return pd.Series(mapped[codes], index=series.index, dtype=object)
+
+
+def _first_row_positions(df: pd.DataFrame, cols: list[str]) -> np.ndarray:
+    """
+    Row positions of the first occurrence of each distinct key in cols.
+
+    Same rows as drop_duplicates(subset=cols, keep="first") (missing values
+    compare equal), computed from per-column factorize codes: the codes are
+    folded into one exact int64 group id per row (re-factorized after each
+    column so it never overflows), and since factorize numbers groups in
+    order of appearance, a row is a first occurrence exactly when its id
+    exceeds every id before it. No hashing of combined rows, no sort.
+    """
+    group_ids = np.zeros(len(df), dtype=np.int64)
+    for col in cols:
+        codes, uniques = pd.factorize(df[col])                     # missing -> -1
+        group_ids, _ = pd.factorize(group_ids * (len(uniques) + 1) + (codes + 1))
+    if len(group_ids) == 0:
+        return np.arange(0)
+    seen_max = np.maximum.accumulate(group_ids)
+    is_first = np.empty(len(group_ids), dtype=bool)
+    is_first[0] = True
+    is_first[1:] = group_ids[1:] > seen_max[:-1]
+    return np.flatnonzero(is_first)
+
 
 def normalize_plan_id_series(series: pd.Series, *, string_dtype: bool = True) -> pd.Series:
     """Strip plan IDs with optional pandas string dtype output.
@@ -107,7 +304,8 @@ def normalize_plan_id_series(series: pd.Series, *, string_dtype: bool = True) ->
     Use string_dtype=False to preserve legacy object/str behavior.
     """
     if string_dtype:
-        return series.astype("string").str.strip()                # '.str.strip()' vectorized string operation (in all Series)
+        # A few dozen plans per export: stripped once per distinct plan ID
+        return _normalize_distinct(series, lambda ids: ids.astype("string").str.strip())
     return series.astype(str).str.strip()
 
 
@@ -117,11 +315,25 @@ def to_date_series(
     format: str | None = None,
     dayfirst: bool | None = None,
 ) -> pd.Series:
-    """Parse dates to datetime.date while preserving missingness."""
-    # pd.to_datetime(..) converts the Series to pandas datetime dtype
-    # .dt accessor is for datetime-like Series
-    # .date converts each timestamp to a Python 'datetime.date' (no time-of-day) -> extracts the date
-    return pd.to_datetime(series, errors=errors, format=format, dayfirst=dayfirst).dt.date
+    """Parse dates to datetime64[ns] at midnight while preserving missingness (NaT).
+
+    Text columns are tried with an explicit ISO "%Y-%m-%d" format first (the
+    C strptime fast path, no per-value format inference); if any present value
+    fails it, the column is parsed the original way instead.
+    """
+    dt = None
+    if format is None and dayfirst is None and errors == "coerce" and (
+        series.dtype == object or isinstance(series.dtype, pd.StringDtype)
+    ):
+        iso = pd.to_datetime(series, errors="coerce", format=_ISO_DATE_FORMAT)
+        if not (iso.isna() & series.notna()).any():
+            dt = iso
+    if dt is None:
+        # pd.to_datetime(..) converts the Series to pandas datetime dtype
+        dt = pd.to_datetime(series, errors=errors, format=format, dayfirst=dayfirst)
+    # .dt.normalize() drops time-of-day but stays datetime64 (no Python 'datetime.date'
+    #   object per row); downstream engines compare/parse datetime64 for free.
+    return dt.dt.normalize()
 
 
 def apply_date_filter(
@@ -136,17 +348,21 @@ def apply_date_filter(
     if date_col not in df.columns:
         raise ValueError(f"Expected date column {date_col!r} for filtering.")
     dt = pd.to_datetime(df[date_col], errors="coerce")
-    # Normalize to date to avoid time-of-day exclusions and tz-aware comparisons.
-    date_values = dt.dt.date
-    mask = date_values.notna()
+    if dt.dt.tz is not None:
+        dt = dt.dt.tz_localize(None)      # keep local wall-clock time, drop the zone
+    # Truncate to whole days (datetime64[D]) to avoid time-of-day exclusions;
+    # the bounds are compared as datetime64[D] too, so the whole filter runs on
+    # int64 day counts instead of one Python date object per row.
+    days = dt.to_numpy().astype("datetime64[D]")
+    mask = ~np.isnat(days)
     if date_start is not None:
-        mask &= date_values >= date_start
+        mask &= days >= np.datetime64(date_start, "D")
     if date_end is not None:
-        mask &= date_values <= date_end
+        mask &= days <= np.datetime64(date_end, "D")
     if months is not None:
-        months_series = pd.to_datetime(date_values, errors="coerce").dt.month
-        mask &= months_series.isin(months)
-    return df.loc[mask].copy()
+        month_numbers = days.astype("datetime64[M]").astype("int64") % 12 + 1
+        mask &= np.isin(month_numbers, months)
+    return df.iloc[np.flatnonzero(mask)]  # Copy-on-Write: no defensive .copy() needed
 
 
 def year_from_date_series(date_series: pd.Series) -> pd.Series:
@@ -172,13 +388,18 @@ def attained_age_by_year_end(
     Returns False for rows with invalid or missing dates/years.
     """
     dob_dt = pd.to_datetime(dob_series, errors="coerce")
-    years_int = pd.to_numeric(year_series, errors="coerce").astype("Int64")
-    year_end = pd.to_datetime(years_int.astype("string") + "-12-31", errors="coerce")
-    threshold_date = dob_dt + pd.DateOffset(years=years, months=months)
-    result = pd.Series(False, index=dob_series.index)
-    valid = dob_dt.notna() & year_end.notna()
-    result.loc[valid] = threshold_date[valid] <= year_end[valid]
-    return result
+    year_values = pd.to_numeric(year_series, errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+
+    # dob + offset falls on/before Dec 31 of Y exactly when its calendar year
+    # is <= Y (day clipping never changes the year), so the whole check is a
+    # single integer comparison on month counts since 1970.
+    dob_months = dob_dt.to_numpy().astype("datetime64[M]")
+    threshold_months = dob_months.astype("int64") + years * 12 + months
+    threshold_year = threshold_months // 12 + 1970
+
+    # Years whose Dec 31 is outside the datetime64[ns] range count as invalid.
+    valid = ~np.isnat(dob_months) & (year_values >= 1677) & (year_values <= 2261)
+    return pd.Series(valid & (threshold_year <= year_values), index=dob_series.index)
 
 def to_numeric_series(series: pd.Series) -> pd.Series:
     """Coerce values to numeric, returning floats with NaN for invalid entries."""
@@ -222,7 +443,15 @@ def normalize_tax_code_series(series: pd.Series) -> pd.Series:
         '7 - Normal Distributions' -> '7'
         'G - Rollover' -> 'G'
         '11 - Loan' -> '11'
+
+    Tax codes are a small closed set, so the regex runs once per distinct
+    raw value and the result is broadcast back through factorize codes.
     """
+    return _normalize_distinct(series, _extract_tax_codes)
+
+
+def _extract_tax_codes(series: pd.Series) -> pd.Series:
+    """Column-wide tax code extraction; see normalize_tax_code_series()."""
     s = series.astype("string")
 
     # '.str.extract(pattern, expand=False) applies a regex to each string in the Series
@@ -234,9 +463,8 @@ def normalize_tax_code_series(series: pd.Series) -> pd.Series:
     # [A-Za-z0-9] captures letters (upper/lower) or digits
     # {1,2} means "repeat 1 or 2 times"
     # The Group captures the first 1-2 alphanumeric character after any leading spaces
-    codes = s.str.extract(r"^\s*([A-Za-z0-9]{1,2})", expand=False)
-    codes = codes.str.upper()     # '.str' vectorize to the whole Series
-    return codes.astype("string") # .astype("string") convert to pandas string dtype(with <NA> for missing)
+    codes = s.str.extract(_RE_TAX_CODE, expand=False)            # pattern compiled once at import
+    return codes.str.upper()      # '.str' vectorize to the whole Series; stays pandas string dtype (<NA> for missing)
 
 
 def _normalize_compact_upper(series: pd.Series) -> pd.Series:
@@ -245,8 +473,7 @@ def _normalize_compact_upper(series: pd.Series) -> pd.Series:
         series.astype("string")
         .str.strip()
         .str.upper()
-        .str.replace(r"\s+", "", regex=True)
-        .str.replace("-", "", regex=False)
+        .str.replace(_RE_WHITESPACE_OR_HYPHEN, "", regex=True)   # spaces and hyphens in one pass
     )
 
 
@@ -255,25 +482,23 @@ def _normalize_space_lower(series: pd.Series) -> pd.Series:
     return (
         series.astype("string")
         .str.strip()
-        .str.replace(r"\s+", " ", regex=True)
+        .str.replace(_RE_WHITESPACE, " ", regex=True)
         .str.lower()
     )
 
 
 def _is_ira_plan(series: pd.Series, cfg: IraRolloverConfig) -> pd.Series:
     """Return an IRA plan mask using configured prefixes/substrings."""
-    normalized = series.astype("string").str.strip().str.upper()
     prefixes = tuple(prefix.upper() for prefix in cfg.ira_plan_prefixes)
-    substrings = tuple(substring.upper() for substring in cfg.ira_plan_substrings)
-    filled = normalized.fillna("")
-    prefix_match = (
-        filled.str.startswith(prefixes) if prefixes else pd.Series(False, index=filled.index)
-    )
-    substring_match = pd.Series(False, index=filled.index)
-    for substring in substrings:
-        if substring:
-            substring_match |= filled.str.contains(substring, regex=False)
-    return prefix_match | substring_match
+    substrings = tuple(substring.upper() for substring in cfg.ira_plan_substrings if substring)
+
+    def is_ira(plan_id: str) -> bool:
+        # Plain str.startswith / `in`: literal matching, no regex engine
+        return plan_id.startswith(prefixes) or any(sub in plan_id for sub in substrings)
+
+    # Each distinct plan ID is checked once; missing plan IDs are tested as ""
+    mask = _map_distinct(series, lambda value: is_ira(str(value).strip().upper()), na_value=is_ira(""))
+    return mask.astype(bool)
 
 
 def _normalize_action_tokens(action_val: object) -> list[str]:
@@ -283,6 +508,44 @@ def _normalize_action_tokens(action_val: object) -> list[str]:
     return [part.strip().upper() for part in parts if part.strip()]
 
 
+def _action_token_mask(action: pd.Series, actions) -> np.ndarray:
+    """
+    Return a bool ndarray: True where any action token is in actions.
+
+    Action strings repeat heavily (a handful of distinct values), so each
+    distinct value is tokenized and tested once and the result is broadcast
+    back to rows by its factorize code; missing actions never match.
+    """
+    wanted = set(actions)
+    codes, uniques = pd.factorize(action)
+    hits = [
+        any(token in wanted for token in _normalize_action_tokens(value))
+        for value in uniques
+    ]
+    # Trailing False slot: code -1 (missing action) indexes it.
+    return np.array(hits + [False], dtype=bool)[codes]
+
+
+def match_status_mask(status: pd.Series, *statuses: str) -> np.ndarray:
+    """
+    Return a bool ndarray marking rows whose match_status is one of statuses.
+
+    Categorical columns are compared on their integer codes (one category
+    lookup per status); other columns are compared on the raw object values,
+    with missing entries never matching.
+    """
+    if isinstance(status.dtype, pd.CategoricalDtype):
+        categories = status.cat.categories
+        wanted = [categories.get_loc(value) for value in statuses if value in categories]
+        return np.isin(status.cat.codes.to_numpy(), wanted)
+
+    values = status.to_numpy(dtype=object, na_value=None)
+    mask = np.zeros(len(values), dtype=bool)
+    for value in statuses:
+        mask |= np.equal(values, value, dtype=bool)
+    return mask
+
+
 def split_corrections_by_action(corrections_df: pd.DataFrame) -> dict[str, pd.DataFrame]:
     """
     Split corrections into separate DataFrames for UPDATE_1099 and INVESTIGATE actions.
@@ -290,20 +553,21 @@ def split_corrections_by_action(corrections_df: pd.DataFrame) -> dict[str, pd.Da
     Rows with both actions are duplicated into both outputs.
     """
     if corrections_df.empty:
-        empty = corrections_df.iloc[:0].copy()
-        return {"Correction": empty.copy(), "Investigate": empty.copy()}
+        empty = corrections_df.iloc[:0]
+        return {"Correction": empty, "Investigate": empty.copy()}
 
     action_col = "Action" if "Action" in corrections_df.columns else "action"
     if action_col not in corrections_df.columns:
-        empty = corrections_df.iloc[:0].copy()
-        return {"Correction": empty.copy(), "Investigate": empty.copy()}
+        empty = corrections_df.iloc[:0]
+        return {"Correction": empty, "Investigate": empty.copy()}
 
-    action_tokens = corrections_df[action_col].apply(_normalize_action_tokens)
-    mask_update = action_tokens.apply(lambda tokens: "UPDATE_1099" in tokens)
-    mask_investigate = action_tokens.apply(lambda tokens: "INVESTIGATE" in tokens)
+    mask_update = _action_token_mask(corrections_df[action_col], ["UPDATE_1099"])
+    mask_investigate = _action_token_mask(corrections_df[action_col], ["INVESTIGATE"])
 
-    correction_df = corrections_df.loc[mask_update].copy()
-    investigate_df = corrections_df.loc[mask_investigate].copy()
+    # Positional takes are new frames; no .copy() needed before relabeling
+    # the action column (Copy-on-Write leaves corrections_df untouched).
+    correction_df = corrections_df.iloc[np.flatnonzero(mask_update)]
+    investigate_df = corrections_df.iloc[np.flatnonzero(mask_investigate)]
 
     if not correction_df.empty:
         correction_df.loc[:, action_col] = "UPDATE_1099"
@@ -327,11 +591,42 @@ def _to_datetime(series: pd.Series) -> pd.Series:
 def _compute_age_years(dob: pd.Series, asof: pd.Series) -> pd.Series:
     """Compute year-based age using the year component of datetime series.
 
-    Returns a Float64 series with missing values preserved.
+    Works on the datetime64 buffers directly (truncated to whole years) and
+    returns a float64 series with NaN where either date is missing.
+    """
+    return _age_from_year_buffers(_year_buffer(dob), _year_buffer(asof), dob.index)
+
+
+def _compute_ages_both(
+    dob: pd.Series,
+    txn: pd.Series,
+    term: pd.Series,
+) -> tuple[pd.Series, pd.Series]:
+    """Compute (age_at_txn, age_at_termination) reading the dob buffer once.
+
+    Same semantics as calling _compute_age_years() for each as-of column.
     """
-    dob_year = dob.dt.year
-    asof_year = asof.dt.year
-    return (asof_year - dob_year).astype("Float64")
+    dob_years = _year_buffer(dob)
+    return (
+        _age_from_year_buffers(dob_years, _year_buffer(txn), dob.index),
+        _age_from_year_buffers(dob_years, _year_buffer(term), dob.index),
+    )
+
+
+def _year_buffer(series: pd.Series) -> np.ndarray:
+    """Return a datetime series as a datetime64[Y] ndarray (NaT preserved)."""
+    return series.to_numpy(dtype="datetime64[ns]").astype("datetime64[Y]")
+
+
+def _age_from_year_buffers(
+    dob_years: np.ndarray,
+    asof_years: np.ndarray,
+    index: pd.Index,
+) -> pd.Series:
+    """Whole-year age from datetime64[Y] buffers; NaN where either side is NaT."""
+    valid = ~(np.isnat(dob_years) | np.isnat(asof_years))
+    age = np.where(valid, (asof_years - dob_years).astype("int64"), np.nan)
+    return pd.Series(age, index=index, dtype="float64")
 
 
 def _compute_start_year(df: pd.DataFrame) -> pd.Series:
@@ -376,8 +671,11 @@ def _is_roth_plan(
     """Return a Roth plan mask using configured prefixes/suffixes.
 
     Use case_insensitive=True to match normalized, uppercased plan IDs.
+    Plan IDs repeat across many rows, so the string checks run once per
+    distinct plan_id and are broadcast back through factorize codes.
     """
-    normalized = series.astype("string")
+    codes, uniques = pd.factorize(series)
+    normalized = pd.Series(uniques, dtype="string")
     if strip:
         normalized = normalized.str.strip()
     prefixes = cfg.roth_plan_prefixes
@@ -386,11 +684,11 @@ def _is_roth_plan(
         normalized = normalized.str.upper()
         prefixes = tuple(prefix.upper() for prefix in prefixes)
         suffixes = tuple(suffix.upper() for suffix in suffixes)
-    filled = normalized.fillna("")
-    prefix_match = pd.Series(False, index=filled.index)
-    suffix_match = pd.Series(False, index=filled.index)
+    is_roth = np.zeros(len(normalized), dtype=bool)
     if prefixes:
-        prefix_match = filled.str.startswith(prefixes)
+        is_roth |= normalized.str.startswith(prefixes).to_numpy(dtype=bool)
     if suffixes:
-        suffix_match = filled.str.endswith(suffixes)
-    return prefix_match | suffix_match
+        is_roth |= normalized.str.endswith(suffixes).to_numpy(dtype=bool)
+    # code -1 (missing plan_id) -> non-Roth
+    mask = (codes >= 0) & is_roth[codes]
+    return pd.Series(mask, index=series.index, dtype="boolean")
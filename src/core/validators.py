@@ -34,7 +34,9 @@ from datetime import date, datetime
 from numbers import Integral
 from typing import Any
 
+import numpy as np
 import pandas as pd
+from pandas.api.types import is_list_like
 
 from ..config import DATE_FILTER_ALL, DATE_FILTER_CONFIG, DateFilterConfig
 
@@ -52,6 +54,36 @@ VALID_1099R_CODES = {
     "Q",
 }
 
+# Issue names in flag-bit order, and for every combination of set bits the
+# names it stands for (bit i of the code -> names[i]), so per-row issue lists
+# are built from one packed code per row instead of one pass per flag.
+_VALIDATION_ISSUE_NAMES = ("ssn_invalid", "amount_invalid", "date_invalid", "code_1099r_invalid")
+_CROSS_ISSUE_NAMES = (
+    "cross_code_g_taxable_over_10pct",
+    "cross_taxable_exceeds_gross_150pct",
+    "cross_code1_age_over_59_5",
+)
+
+
+def _issue_combinations(names: tuple[str, ...]) -> tuple[tuple[str, ...], ...]:
+    return tuple(
+        tuple(name for bit, name in enumerate(names) if code >> bit & 1)
+        for code in range(1 << len(names))
+    )
+
+
+_VALIDATION_ISSUE_COMBOS = _issue_combinations(_VALIDATION_ISSUE_NAMES)
+_CROSS_ISSUE_COMBOS = _issue_combinations(_CROSS_ISSUE_NAMES)
+
+
+def _pack_flags(masks: list[np.ndarray], n: int) -> np.ndarray:
+    """Pack up to 8 row-aligned bool arrays into one uint8 code per row (mask i -> bit i)."""
+    codes = np.zeros(n, dtype=np.uint8)
+    for bit, mask in enumerate(masks):
+        codes |= mask.astype(np.uint8) << bit
+    return codes
+
+
 _MONTH_ALIASES = {
     "jan": 1,
     "january": 1,
@@ -201,8 +233,14 @@ def validate_ssn(ssn_clean: Any) -> bool:
 
 
 def validate_ssn_series(series: pd.Series) -> pd.Series:
-    """Vectorized SSN validation with boolean output."""
-    return series.map(validate_ssn).astype("boolean")
+    """Vectorized SSN validation with boolean output.
+
+    validate_ssn() runs once per distinct SSN (participants repeat across
+    distribution rows) and is broadcast back by factorize code; missing -> False.
+    """
+    codes, uniques = pd.factorize(series)
+    valid = np.array([validate_ssn(value) for value in uniques] + [False], dtype=bool)
+    return pd.Series(valid[codes], index=series.index, dtype="boolean")
 
 
 def validate_amounts(
@@ -381,23 +419,24 @@ def cross_validate_series(
     code_clean = code.astype("string").str.strip().str.upper()
     age_series = pd.to_numeric(age, errors="coerce") if age is not None else None
 
-    issues = pd.Series([[] for _ in range(len(gross_series))], index=gross_series.index)
-
     has_amounts = gross_series.notna() & taxable_series.notna()
     mask_code_g = has_amounts & code_clean.eq("G") & (taxable_series > (gross_series * 0.1))
     mask_taxable_big = has_amounts & (taxable_series > (gross_series * 1.5))
-
-    for idx in mask_code_g[mask_code_g].index:
-        issues.at[idx].append("cross_code_g_taxable_over_10pct")
-    for idx in mask_taxable_big[mask_taxable_big].index:
-        issues.at[idx].append("cross_taxable_exceeds_gross_150pct")
+    masks = [
+        mask_code_g.to_numpy(dtype=bool, na_value=False),
+        mask_taxable_big.to_numpy(dtype=bool, na_value=False),
+    ]
 
     if age_series is not None:
         mask_code1_age = code_clean.eq("1") & age_series.notna() & (age_series >= 59.5)
-        for idx in mask_code1_age[mask_code1_age].index:
-            issues.at[idx].append("cross_code1_age_over_59_5")
+        masks.append(mask_code1_age.to_numpy(dtype=bool, na_value=False))
 
-    return issues
+    codes = _pack_flags(masks, len(gross_series))
+    return pd.Series(
+        [list(_CROSS_ISSUE_COMBOS[code]) for code in codes],
+        index=gross_series.index,
+        dtype=object,
+    )
 
 
 def build_validation_issues(
@@ -408,26 +447,27 @@ def build_validation_issues(
     *,
     cross_field_issues: pd.Series | None = None,
 ) -> pd.Series:
-    """Build per-row validation issue lists from boolean flags."""
-    issues = pd.Series([[] for _ in range(len(ssn_valid))], index=ssn_valid.index)
-
-    invalid_ssn = ssn_valid.eq(False).fillna(False)
-    invalid_amount = amount_valid.eq(False).fillna(False)
-    invalid_date = date_valid.eq(False).fillna(False)
-    invalid_code = code_1099r_valid.eq(False).fillna(False)
-
-    for idx in invalid_ssn[invalid_ssn].index:
-        issues.at[idx].append("ssn_invalid")
-    for idx in invalid_amount[invalid_amount].index:
-        issues.at[idx].append("amount_invalid")
-    for idx in invalid_date[invalid_date].index:
-        issues.at[idx].append("date_invalid")
-    for idx in invalid_code[invalid_code].index:
-        issues.at[idx].append("code_1099r_invalid")
+    """
+    Build per-row validation issue lists from boolean flags.
+
+    The four flags (False -> issue; True/<NA> -> none) are packed into one
+    4-bit code per row and each row's list comes from a 16-entry table, in a
+    single pass. cross_field_issues, when given, is aligned to the flags by
+    index label; its names are appended after the flag issues, and rows
+    without an entry (missing label, None/NaN or an empty list) get none.
+    """
+    flags = (ssn_valid, amount_valid, date_valid, code_1099r_valid)
+    codes = _pack_flags(
+        [flag.eq(False).to_numpy(dtype=bool, na_value=False) for flag in flags],
+        len(ssn_valid),
+    )
+    rows = [list(_VALIDATION_ISSUE_COMBOS[code]) for code in codes]
 
     if cross_field_issues is not None:
-        for idx, row_issues in cross_field_issues.items():
-            if row_issues:
-                issues.at[idx].extend(row_issues)
-
-    return issues
+        if not cross_field_issues.index.equals(ssn_valid.index):
+            cross_field_issues = cross_field_issues.reindex(ssn_valid.index)
+        # Only list-like, non-empty entries are appended; missing ones are skipped
+        for row, extra in zip(rows, cross_field_issues.to_numpy(dtype=object)):
+            if is_list_like(extra) and len(extra):
+                row.extend(extra)
+    return pd.Series(rows, index=ssn_valid.index, dtype=object)
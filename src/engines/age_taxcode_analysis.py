@@ -93,6 +93,7 @@ Public API
 
 
 from __future__ import annotations
+import numpy as np
 import pandas as pd
 from ..config import (
     AGE_TAXCODE_CONFIG,
@@ -106,13 +107,19 @@ from ..core.normalizers import (
     apply_date_filter,
     attained_age_by_year_end,
     normalize_tax_code_series,
-    _is_roth_plan,
     to_date_series,
+    _is_roth_plan,
 )
 
 import warnings
 
 
+def _isin_by_codes(series: pd.Series, values: frozenset) -> np.ndarray:
+    """Membership test hashed on distinct values, broadcast via factorize codes."""
+    codes, uniques = pd.factorize(series)
+    hit = np.fromiter((u in values for u in uniques), dtype=bool, count=len(uniques))
+    return (codes >= 0) & hit[codes]
+
 
 def attach_demo_to_matrix(
         matrix_df: pd.DataFrame,
@@ -131,7 +138,7 @@ def attach_demo_to_matrix(
     key_cols = ["plan_id", "ssn"]
 
     demo_cols = ["dob", "term_date", "first_name", "last_name"]
-    demo = relius_demo_df[key_cols + demo_cols].copy()
+    demo = relius_demo_df[key_cols + demo_cols]
 
     merged = matrix_df.merge(
         demo,
@@ -140,7 +147,7 @@ def attach_demo_to_matrix(
         suffixes=("", "_demo")
     )
 
-    # Defensive: make sure these are dates
+    # Defensive: make sure these are midnight datetime64 (no-op for cleaned demo input)
     merged["dob"] = to_date_series(merged["dob"])
     merged["term_date"] = to_date_series(merged["term_date"])
 
@@ -150,12 +157,18 @@ def attach_demo_to_matrix(
     else:
         merged["full_name"] = pd.NA
     
-    mask_missing = merged["full_name"].isna()
-    merged.loc[mask_missing, "full_name"] = (
-        merged.loc[mask_missing, "first_name"].fillna("").str.strip()
-        + " "
-        + merged.loc[mask_missing, "last_name"].fillna("").str.strip()
-    ).str.strip().replace("", pd.NA)
+    # Build the "First Last" fallback only for rows missing a name, using
+    # NumPy string ops on the subset instead of whole-column temporaries.
+    mask_missing = merged["full_name"].isna().to_numpy()
+    if mask_missing.any():
+        first = merged.loc[mask_missing, "first_name"].fillna("").to_numpy(dtype=str)
+        last = merged.loc[mask_missing, "last_name"].fillna("").to_numpy(dtype=str)
+        combined = np.char.strip(
+            np.char.add(np.char.add(np.char.strip(first), " "), np.char.strip(last))
+        )
+        merged.loc[mask_missing, "full_name"] = np.where(
+            combined == "", pd.NA, combined.astype(object)
+        )
 
     return merged
 
@@ -219,8 +232,10 @@ def run_age_taxcode_analysis(
     df = attach_demo_to_matrix(matrix_filtered, relius_demo_df)
 
     # Normalize tax codes defensively to ensure 1–2 character codes
+    # (skipped when clean_matrix() already normalized them)
+    tax_codes_normalized = matrix_df.attrs.get("tax_codes_normalized", False)
     for col in ["tax_code_1", "tax_code_2"]:
-        if col in df.columns:
+        if col in df.columns and not tax_codes_normalized:
             df[col] = normalize_tax_code_series(df[col])
             lengths = df[col].str.len()
             invalid_tax = df[col].notna() & lengths.gt(2)
@@ -231,9 +246,7 @@ def run_age_taxcode_analysis(
                     stacklevel=2,
                 )
 
-    # 3) Flags: rollover, inherited, Roth (Roth handled by Engine C)
-    mask_rollover_code = df["tax_code_1"].isin(cfg.excluded_codes)   # G, H
-    mask_inherited_plan = df["plan_id"].isin(INHERITED_PLAN_IDS)
+    # 3) Flags: Roth (handled by Engine C), then rollover / inherited
     is_roth_plan = _is_roth_plan(
         df["plan_id"],
         ROTH_TAXABLE_CONFIG,
@@ -241,10 +254,14 @@ def run_age_taxcode_analysis(
     )
 
     # Filter out Roth rows entirely
-    df = df[~is_roth_plan].copy()
+    df = df[~is_roth_plan]
 
-    # Exclude rollover and inherited plans from this engine
-    df["age_engine_excluded"] = mask_rollover_code | mask_inherited_plan
+    # Exclude rollover (G, H, ...) and inherited plans from this engine in one
+    # pass over the surviving rows, hashing each distinct value only once.
+    df["age_engine_excluded"] = (
+        _isin_by_codes(df["tax_code_1"], cfg.excluded_codes)
+        | _isin_by_codes(df["plan_id"], INHERITED_PLAN_IDS)
+    )
 
     # 4) Compute year fields and attained-age flags
     dob_dt = pd.to_datetime(df["dob"], errors="coerce")
@@ -268,62 +285,75 @@ def run_age_taxcode_analysis(
     df["attained_55_in_txn_year"] = attained_55_txn
     df["attained_55_in_term_year"] = attained_55_term
 
-    has_dob = dob_dt.notna()
-    has_txn_year = txn_year.notna()
-    has_term_year = term_year.notna()
-    eligible_any = ~df["age_engine_excluded"] & has_dob & has_txn_year
+    # Read every flag into a plain bool ndarray once; the rule tree below
+    # combines them without Series alignment or extra Series allocations.
+    excluded = df["age_engine_excluded"].to_numpy(dtype=bool)
+    has_dob = dob_dt.notna().to_numpy()
+    has_txn_year = txn_year.notna().to_numpy()
+    has_term_year = term_year.notna().to_numpy()
+    attained_59_5 = attained_59_5.to_numpy(dtype=bool)
+    attained_55_term = attained_55_term.to_numpy(dtype=bool)
+    attained_55_txn = attained_55_txn.to_numpy(dtype=bool)
+    eligible_any = ~excluded & has_dob & has_txn_year
+
+    # ------------------------------------------------------------
+    # NON-ROTH AGE RULES (7 / 2 / 1 in tax_code_1)
+    # ------------------------------------------------------------
+    # Each eligible row lands in exactly one rule, so the whole tree is
+    # evaluated once into an int8 rule index (0 = no rule) and decoded via
+    # lookup tables instead of materializing one boolean mask per leaf.
+    #   1: age >= 59.5 at distribution             → 7
+    #   2: age < 59.5, term date, term age >= 55   → 2
+    #   3: age < 59.5, term date, term age < 55    → 1
+    #   4: age < 59.5, no term date, txn age < 55  → 1
+    #   5: age < 59.5, no term date, txn age >= 55 → 2
+    under_595_rule = np.where(
+        has_term_year,
+        np.where(attained_55_term, 2, 3),
+        np.where(attained_55_txn, 5, 4),
+    )
+    rule_idx = np.where(
+        eligible_any,
+        np.where(attained_59_5, 1, under_595_rule),
+        0,
+    ).astype(np.int8)
+
+    rule_code_table = np.array(
+        [
+            pd.NA,
+            cfg.normal_dist_code,
+            cfg.age_55_plus_code,
+            cfg.under_55_code,
+            cfg.under_55_code,
+            cfg.age_55_plus_code,
+        ],
+        dtype=object,
+    )
+    rule_reason_table = np.array(
+        [
+            pd.NA,
+            "age_59_5_or_over_normal_distribution",
+            "terminated_at_or_after_55",
+            "terminated_before_55",
+            "no_term_date_under_55_in_txn_year",
+            "no_term_date_55_plus_in_txn_year",
+        ],
+        dtype=object,
+    )
 
-    # 5) Initialize expected codes and metadata
-    df["expected_tax_code_1"] = pd.NA
+    # 5) Expected codes and metadata decoded from the rule index (0 -> <NA>).
+    df["expected_tax_code_1"] = np.take(rule_code_table, rule_idx)
     df["expected_tax_code_2"] = pd.NA
-    df["correction_reason"] = pd.NA
+    df["correction_reason"] = np.take(rule_reason_table, rule_idx)
     df["action"] = pd.NA
 
     # Default match_status
     df["match_status"] = status_cfg.insufficient_data
-    df.loc[df["age_engine_excluded"], "match_status"] = (
+    df.loc[excluded, "match_status"] = (
         status_cfg.excluded_age_engine
     )
 
 
-    # ------------------------------------------------------------
-    # NON-ROTH AGE RULES (7 / 2 / 1 in tax_code_1)
-    # ------------------------------------------------------------
-    # Rule 1: age >= 59.5 at distribution → 7
-    mask_normal_non_roth = eligible_any & attained_59_5
-    df.loc[mask_normal_non_roth, "expected_tax_code_1"] = cfg.normal_dist_code
-    df.loc[mask_normal_non_roth, "correction_reason"] = "age_59_5_or_over_normal_distribution"
-
-    # Rule 2: age < 59.5
-    mask_under_595_non_roth = eligible_any & ~mask_normal_non_roth
-
-    # 2.1 with term date
-    mask_under_595_with_term_non = mask_under_595_non_roth & has_term_year
-
-    # Term age >= 55 → 2
-    mask_term_55_plus_non = mask_under_595_with_term_non & attained_55_term
-    df.loc[mask_term_55_plus_non, "expected_tax_code_1"] = cfg.age_55_plus_code
-    df.loc[mask_term_55_plus_non, "correction_reason"] = "terminated_at_or_after_55"
-
-    # Term age < 55 → 1
-    mask_term_under_55_non = mask_under_595_with_term_non & ~attained_55_term
-    df.loc[mask_term_under_55_non, "expected_tax_code_1"] = cfg.under_55_code
-    df.loc[mask_term_under_55_non, "correction_reason"] = "terminated_before_55"
-
-    # 2.2 no term date → use age at distribution vs 55
-    mask_under_595_no_term_non = mask_under_595_non_roth & ~has_term_year
-
-    # <55 → 1
-    mask_dist_under_55_non = mask_under_595_no_term_non & ~attained_55_txn
-    df.loc[mask_dist_under_55_non, "expected_tax_code_1"] = cfg.under_55_code
-    df.loc[mask_dist_under_55_non, "correction_reason"] = "no_term_date_under_55_in_txn_year"
-
-    # >=55 → 2
-    mask_dist_55_plus_non = mask_under_595_no_term_non & attained_55_txn
-    df.loc[mask_dist_55_plus_non, "expected_tax_code_1"] = cfg.age_55_plus_code
-    df.loc[mask_dist_55_plus_non, "correction_reason"] = "no_term_date_55_plus_in_txn_year"
-
-
     # ------------------------------------------------------------
     # 6) Compare expected vs current codes
     #    - Non-Roth: compare tax_code_1 only
@@ -344,7 +374,7 @@ def run_age_taxcode_analysis(
     df.loc[df["code_matches_expected"], "match_status"] = status_cfg.no_action
 
     # needs correction where we have expected code but Matrix differs
-    need_corr_mask = has_expected & ~df["code_matches_expected"] & ~df["age_engine_excluded"]
+    need_corr_mask = has_expected & ~df["code_matches_expected"] & ~excluded
     df.loc[need_corr_mask, "match_status"] = status_cfg.needs_correction
     df.loc[need_corr_mask, "action"] = "UPDATE_1099"
     df.loc[df["match_status"] == status_cfg.no_action, "correction_reason"] = pd.NA
@@ -26,6 +26,7 @@ Public API
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
 from ..config import (
@@ -76,13 +77,15 @@ def run_ira_rollover_analysis(
 
     status_cfg = MATCH_STATUS_CONFIG
 
-    df = apply_date_filter(matrix_df.copy(), "txn_date", date_filter=date_filter)
+    # No defensive copies (Copy-on-Write): both row filters below are positional
+    #   takes that return new frames before any column is assigned.
+    df = apply_date_filter(matrix_df, "txn_date", date_filter=date_filter)
 
     ira_mask = _is_ira_plan(df["plan_id"], cfg)
     txn_method_norm = _normalize_space_lower(df["txn_method"])
     check_distribution_mask = txn_method_norm == "check distribution"
 
-    df = df[ira_mask & check_distribution_mask].copy()
+    df = df.iloc[np.flatnonzero((ira_mask & check_distribution_mask).to_numpy(dtype=bool, na_value=False))]
     tax_code_1 = normalize_tax_code_series(
         df.get("tax_code_1", pd.Series(pd.NA, index=df.index))
     ).fillna("")
@@ -90,7 +93,7 @@ def run_ira_rollover_analysis(
         df.get("tax_code_2", pd.Series(pd.NA, index=df.index))
     ).fillna("")
     rollover_tax_code_mask = tax_code_1.isin(["G", "H"]) | tax_code_2.isin(["G", "H"])
-    df = df[rollover_tax_code_mask].copy()
+    df = df.iloc[np.flatnonzero(rollover_tax_code_mask.to_numpy(dtype=bool))]
 
     df["match_status"] = status_cfg.needs_review
     df["action"] = pd.NA
@@ -130,8 +133,13 @@ def run_ira_rollover_analysis(
     df.loc[mask_correction, "suggested_tax_code_1"] = "0"
     df.loc[mask_correction, "new_tax_code"] = "0"
     df.loc[df["match_status"] == status_cfg.needs_review, "action"] = "INVESTIGATE"
-    df["correction_reason"] = df["correction_reasons"].apply(
-        lambda reasons: "; ".join(reasons) if reasons else pd.NA
+    df["correction_reason"] = pd.Series(
+        [
+            "; ".join(reasons) if reasons else pd.NA
+            for reasons in df["correction_reasons"].to_numpy()           # raw object array: no Series.apply dispatch
+        ],
+        index=df.index,
+        dtype=object,
     )
     df.loc[mask_correction, "correction_reason"] = (
         "ira_rollover_tax_form_1099r_expected_no_tax"
@@ -109,6 +109,7 @@ from __future__ import annotations # Makes type hints like '-> pd.DataFrame', 'O
 from typing import Iterable, Optional  # Type hints helpers
 
 import pandas as pd
+from pandas.api.types import is_datetime64_dtype
 
 from ..config import (
     DateFilterConfig,
@@ -147,8 +148,8 @@ def _apply_inherited_tax_code_rules(df: pd.DataFrame) -> pd.DataFrame:
         
     """
 
-    # Work on a copy so we don't mutate the cleaned pandas DataFrame
-    df = df.copy()
+    # No defensive df.copy() (Copy-on-Write): the column assignments below
+    #   copy only what they write, never the caller's cleaned DataFrame
 
     # Initialize expectation columns with pandas missing value (<NA>)
     df["expected_tax_code_1"] = pd.NA
@@ -295,23 +296,23 @@ def reconcile_relius_matrix(
 
     """
 
-    # Work on copies
-    r = relius_clean.copy()
-    m = matrix_clean.copy()
+    # No upfront copies (Copy-on-Write): the plan/date filters and the merge
+    #   below all return new frames, so the cleaned inputs are never mutated
+    r = relius_clean
+    m = matrix_clean
     status_cfg = MATCH_STATUS_CONFIG
 
     # Optionally filter by selected plan_ids (user-driven, not hard-coded)
     # set() -> converts to iterable Set for faster plan ID checks.
     # r["plan_id"].isin(plan_ids) -> returns True on the rows when df plan_id is found in our Set plan_ids
     # Then the r[r[..]] filters and keep only the rows where True was returned
-    # .copy() creates a copy of the DataFrame to be assigned to 'r' and 'm' in the next line
     # This allows you to reconcile only a subset of plans (e.g. inherited plans) without changing the matching logic
     if plan_ids is None:
         plan_ids = DEFAULT_RECONCILIATION_PLAN_IDS
     if plan_ids is not None:
         plan_ids = set(plan_ids)
-        r = r[r["plan_id"].isin(plan_ids)].copy()
-        m = m[m["plan_id"].isin(plan_ids)].copy()
+        r = r[r["plan_id"].isin(plan_ids)]
+        m = m[m["plan_id"].isin(plan_ids)]
 
     # Optional date filtering (guardrail if cleaning is bypassed)
     r = apply_date_filter(r, "exported_date", date_filter=date_filter)
@@ -338,15 +339,12 @@ def reconcile_relius_matrix(
 
     # Normalize dates and compute date lag
     # pd.to_datetime(Series, errors="coerce") -> converts many date formats to pandas datetime, and assing NaT on invalid entries
-    # Ensures both date columns are proper datetime type
-    if "exported_date" in merged.columns:
-        merged["exported_date"] = pd.to_datetime(
-            merged["exported_date"], errors="coerce"
-        )
-    if "txn_date" in merged.columns:
-        merged["txn_date"] = pd.to_datetime(
-            merged["txn_date"], errors="coerce"
-        )
+    # Ensures both date columns are proper datetime type. Cleaned inputs already
+    #   carry datetime64[ns] (midnight) dates on both sides, so the merge keeps
+    #   them as int64-backed columns and only raw/text dates are parsed here.
+    for date_col in ("exported_date", "txn_date"):
+        if date_col in merged.columns and not is_datetime64_dtype(merged[date_col]):
+            merged[date_col] = pd.to_datetime(merged[date_col], errors="coerce")
 
     # If both columns are in merged DataFrame:
     #   1) Substract two datetime series
@@ -77,6 +77,7 @@ Public API
 
 from __future__ import annotations   # makes type hints ("annotations") be stored as strings.
 
+import numpy as np
 import pandas as pd
 
 from ..config import (                # Relative import from the config module.
@@ -91,7 +92,7 @@ from ..config import (                # Relative import from the config module.
 from ..core.normalizers import (
     _append_action,
     _append_reason,
-    _compute_age_years,
+    _compute_ages_both,
     _compute_start_year,
     _is_roth_plan,
     _to_datetime,
@@ -117,14 +118,17 @@ def run_roth_taxable_analysis(
     Note: `correction_reason` joins all triggered reasons with '; ' for quick notebook review.
     """
     
-    df = matrix_df.copy()
-    df = apply_date_filter(df, "txn_date", date_filter=date_filter)
+    # No defensive matrix_df.copy() (Copy-on-Write): the plan filter is a
+    #   positional take that returns a new frame before any column is assigned.
+    df = apply_date_filter(matrix_df, "txn_date", date_filter=date_filter)
     status_cfg = MATCH_STATUS_CONFIG
-    df["plan_id"] = normalize_plan_id_series(df["plan_id"], string_dtype=False)
+    plan_id = normalize_plan_id_series(df["plan_id"], string_dtype=False)
 
-    mask_roth = _is_roth_plan(df["plan_id"], cfg)
-    mask_not_inherited = ~df["plan_id"].isin(INHERITED_PLAN_IDS)
-    df = df[mask_roth & mask_not_inherited].copy()
+    mask_roth = _is_roth_plan(plan_id, cfg)
+    mask_not_inherited = ~plan_id.isin(INHERITED_PLAN_IDS)
+    keep_rows = np.flatnonzero((mask_roth & mask_not_inherited).to_numpy(dtype=bool, na_value=False))
+    df = df.iloc[keep_rows]
+    df["plan_id"] = plan_id.to_numpy()[keep_rows]
 
     demo_cols = [c for c in ["plan_id", "ssn", "dob", "term_date"] if c in relius_demo_df.columns]
     basis_cols = ["plan_id", "ssn", "first_roth_tax_year", "roth_basis_amt"]
@@ -142,8 +146,9 @@ def run_roth_taxable_analysis(
 
     df["txn_year"] = df["txn_date"].dt.year
     df["term_year"] = df["term_date"].dt.year
-    df["age_at_txn"] = _compute_age_years(df["dob"], df["txn_date"])
-    df["age_at_termination"] = _compute_age_years(df["dob"], df["term_date"])
+    df["age_at_txn"], df["age_at_termination"] = _compute_ages_both(
+        df["dob"], df["txn_date"], df["term_date"]
+    )
 
     df["gross_amt"] = to_numeric_series(df["gross_amt"])
     df["fed_taxable_amt"] = to_numeric_series(df.get("fed_taxable_amt", pd.Series(pd.NA, index=df.index)))
@@ -396,11 +401,23 @@ def run_roth_taxable_analysis(
     df.loc[mask_engine_excluded, "match_status"] = tc_cfg.status_excluded
 
     # Finalize actions and match_status precedence
+    # 'actions' holds one Python list per row, so these stay Python-level loops:
+    #   plain comprehensions over the raw object array skip Series.apply's
+    #   per-element dispatch, and the list column is walked once per result.
     action_joiner = tc_cfg.action_joiner
-    df["action"] = df["actions"].apply(lambda acts: action_joiner.join(acts) if acts else pd.NA)
+    actions = df["actions"].to_numpy()
+    df["action"] = pd.Series(
+        [action_joiner.join(acts) if acts else pd.NA for acts in actions],
+        index=df.index,
+        dtype=object,
+    )
 
-    has_update = df["actions"].apply(lambda a: tc_cfg.action_update in a if a is not None else False)
-    has_investigate = df["actions"].apply(lambda a: tc_cfg.action_investigate in a if a is not None else False)
+    action_update = tc_cfg.action_update
+    action_investigate = tc_cfg.action_investigate
+    has_update = np.array([acts is not None and action_update in acts for acts in actions], dtype=bool)
+    has_investigate = np.array(
+        [acts is not None and action_investigate in acts for acts in actions], dtype=bool
+    )
 
     df.loc[~mask_engine_excluded & has_update, "match_status"] = status_cfg.needs_correction
     df.loc[~mask_engine_excluded & ~has_update & has_investigate, "match_status"] = status_cfg.needs_review
@@ -409,8 +426,13 @@ def run_roth_taxable_analysis(
     # Correction reasons with bullet + newline
     reason_joiner = tc_cfg.reason_joiner
     bullet = tc_cfg.reason_bullet
-    df["correction_reason"] = df["correction_reasons"].apply(
-        lambda reasons: reason_joiner.join(f"{bullet}{r}" for r in reasons) if reasons else pd.NA
+    df["correction_reason"] = pd.Series(
+        [
+            reason_joiner.join(f"{bullet}{r}" for r in reasons) if reasons else pd.NA
+            for reasons in df["correction_reasons"].to_numpy()
+        ],
+        index=df.index,
+        dtype=object,
     )
     df.loc[df["match_status"] == status_cfg.no_action, "correction_reason"] = pd.NA
     df.loc[
@@ -457,4 +479,4 @@ def run_roth_taxable_analysis(
         "match_status",
     ]
 
-    return df[out_cols].copy()
+    return df[out_cols]
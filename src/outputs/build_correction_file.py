@@ -105,6 +105,7 @@ from datetime import datetime           # Allows us to get time and date from da
 from pathlib import Path                # Represents filesystem paths in an object-oriented way.
 from typing import Iterable, Optional   # These are for type hints.
 
+import numpy as np
 import pandas as pd
 
 from ..config import (
@@ -114,14 +115,72 @@ from ..config import (
     get_engine_outputs_dir,
     get_engine_samples_dir,
 )         # Relative import from the config module.
-from ..core.normalizers import _normalize_action_tokens, split_corrections_by_action
-from .export_utils import write_multi_sheet_excel
-
+from ..core.normalizers import (
+    _action_token_mask,
+    match_status_mask,
+    split_corrections_by_action,
+)
+from .export_utils import write_multi_sheet_excel, write_parquet_companion
+
+
+# Every matches column build_correction_dataframe reads (filters + template).
+# Anything else on a wide reconcile frame (diagnostics, amounts, Relius-side
+# fields) is never carried into the filtered subset.
+_CORRECTION_INPUT_COLS = frozenset({
+    "transaction_id",
+    "txn_date",
+    "ssn",
+    "participant_name",
+    "full_name",
+    "matrix_account",
+    "tax_code_1",
+    "tax_code_2",
+    "new_tax_code",
+    "suggested_tax_code_1",
+    "suggested_tax_code_2",
+    "suggested_taxable_amt",
+    "suggested_first_roth_tax_year",
+    "correction_reason",
+    "action",
+    "_merge",
+    "date_within_tolerance",
+})
+
+# Expected output columns in Excel correction file (Matrix correction template order)
+_CORRECTION_OUTPUT_COLS = [
+    "Transaction Id",
+    "Transaction Date",
+    "Participant SSN",
+    "Participant Name",
+    "Matrix Account",
+    "Current Tax Code 1",
+    "Current Tax Code 2",
+    "New Tax Code",
+    "New Taxable Amount",
+    "New First Year contrib",
+    "Reason",
+    "Action",
+]
 
 
 # --- Core funtions ------------------------------------------------------------
 
 
+def _clean_code_series(series: pd.Series) -> pd.Series:
+    """
+    Strip + uppercase suggested codes in one pass; blanks and missing -> <NA>.
+
+    Codes are a handful of distinct values, so each distinct value is cleaned
+    once and broadcast back through its factorize code (-1 -> <NA>).
+    """
+    codes, uniques = pd.factorize(series)
+    cleaned = pd.array(
+        [str(value).strip().upper() or pd.NA for value in uniques], dtype="string"
+    )
+    return pd.Series(cleaned.take(codes, allow_fill=True), index=series.index)
+
+
+
 def build_correction_dataframe(
         matches: pd.DataFrame,
         allowed_actions: Optional[Iterable[str]] = ("UPDATE_1099", "INVESTIGATE"),
@@ -167,139 +226,131 @@ def build_correction_dataframe(
 
     """
 
-    df = matches.copy()
-
-    # 1) Basic correction condition: status + actionable suggestion present
-    mask_needs_corr = df["match_status"].isin(
-        ["match_needs_correction", "match_needs_review"]
+    # 1) Basic correction condition: status + actionable suggestion present.
+    #    The status check is the most selective predicate, so shrink the frame
+    #    to those rows first and evaluate every other mask on the subset only.
+    #    (No upfront matches.copy(): nothing below mutates the input frame.)
+    #    Masks stay raw bool ndarrays (no Series alignment / allocation) and
+    #    the frame is narrowed with positional takes, keeping only the columns
+    #    read below so wide inputs aren't copied column by column.
+    mask_needs_corr = match_status_mask(
+        matches["match_status"], "match_needs_correction", "match_needs_review"
     )
-    mask_has_suggestion = pd.Series(False, index=df.index)
+    needed_cols = [
+        pos for pos, col in enumerate(matches.columns) if col in _CORRECTION_INPUT_COLS
+    ]
+    df = matches.iloc[np.flatnonzero(mask_needs_corr), needed_cols]
+    present = frozenset(df.columns)                                    # Column presence checked once; df_corr keeps the same columns.
+    if df.empty:                                                       # Steady state: nothing flagged, skip every other mask.
+        return pd.DataFrame(columns=_CORRECTION_OUTPUT_COLS)
+
+    mask_has_suggestion = np.zeros(len(df), dtype=bool)
     for col in [
         "suggested_tax_code_1",
         "suggested_tax_code_2",
         "suggested_taxable_amt",
         "suggested_first_roth_tax_year",
     ]:
-        if col in df.columns:
-            mask_has_suggestion |= df[col].notna()                     # .notna() -> is Series not missing (NA), returns a boolean Series(True / False)
+        if col in present:
+            mask_has_suggestion |= df[col].notna().to_numpy()          # .notna() -> is Series not missing (NA), returns a boolean Series(True / False)
+
+    if "action" in present:
+        mask_has_suggestion |= _action_token_mask(df["action"], ["INVESTIGATE"])
+
+    # The remaining predicates are ANDed in place into this one owned bool
+    # buffer (created by np.zeros above, so always writable): no all-True
+    # placeholder masks and no intermediate arrays for the '&' chain.
+    corr_mask = mask_has_suggestion
+    if not corr_mask.any():                                            # Nothing actionable: skip the tolerance/action masks.
+        return pd.DataFrame(columns=_CORRECTION_OUTPUT_COLS)
 
     # 2) If '_merge' and 'date_within_tolerance' exist, enforce them;
     #    otherwise assume the input is already filtered.
-    if "_merge" in df.columns:
-        mask_in_range = df["_merge"].eq("both")
-    else:
-        mask_in_range = pd.Series(True, index=df.index) # Creates a Series of all True. df.index same lenght (rows) as df. 
-    
-    if "date_within_tolerance" in df.columns:
-        mask_in_range &= df["date_within_tolerance"].fillna(False)     # .fillna(False) -> replace NA values with boolean False.
-                                                                       # '&=' -> means elementwise AND + assignment. Mean:
-                                                                       #    mask_in_range = mask_in_range & df["date_within_tolerance"].fillna("False")
+    if "_merge" in present:
+        corr_mask &= df["_merge"].eq("both").to_numpy(dtype=bool)
     
-    action_tokens = None
-    if "action" in df.columns:
-        action_tokens = df["action"].apply(_normalize_action_tokens)
-
-    mask_has_investigate = pd.Series(False, index=df.index)
-    if action_tokens is not None:
-        mask_has_investigate = action_tokens.apply(lambda tokens: "INVESTIGATE" in tokens)
-    mask_has_suggestion |= mask_has_investigate
+    if "date_within_tolerance" in present:
+        corr_mask &= df["date_within_tolerance"].to_numpy(dtype=bool, na_value=False)
+                                                                       # na_value=False -> NA becomes False while converting straight
+                                                                       #    to np.bool_ (no fillna pass, no object/nullable mask).
+                                                                       # Only the right-hand side comes from .to_numpy() (possibly a
+                                                                       #    read-only view under Copy-on-Write); it is never written to.
 
     # 3) Filter by allowed actions if 'action' column exists
-    if action_tokens is not None and allowed_actions is not None:
+    if "action" in present and allowed_actions is not None:
         allowed_actions = {
             str(action).strip().upper()
             for action in allowed_actions
             if pd.notna(action)
         }
+        corr_mask &= _action_token_mask(df["action"], allowed_actions)  # multi-action aware
 
-        def _has_allowed(tokens: list[str]) -> bool:
-            return any(token in allowed_actions for token in tokens)
+    df_corr = df.iloc[np.flatnonzero(corr_mask)]                       # Positional take: keeps only rows where corr_mask is True.
 
-        mask_action = action_tokens.apply(_has_allowed)               # multi-action aware
-    else:
-        mask_action = pd.Series(True, index=df.index)                  # Creates a Series of True, for the lenght(rows) of df.
-
-    corr_mask = mask_needs_corr & mask_has_suggestion & mask_in_range & mask_action
-    df_corr = df[corr_mask].copy()                                     # Boolean indexing: keeps only rows where corr_mask is True.
-
-    # Expected output columns in Excel correction file
-    out_cols=[
-        "Transaction Id",
-        "Transaction Date",
-        "Participant SSN",
-        "Participant Name",
-        "Matrix Account",
-        "Current Tax Code 1",
-        "Current Tax Code 2",
-        "New Tax Code",
-        "New Taxable Amount",
-        "New First Year contrib",
-        "Reason",
-        "Action",
-    ]
 
     if df_corr.empty:                                                  # True if there are no rows in df_corr DataFrame
         # Return an empty DataFrame with the expected columns
-        return pd.DataFrame(columns=out_cols)                          # Creates an empty DataFrame with the correction template's columns and returns it.
+        return pd.DataFrame(columns=_CORRECTION_OUTPUT_COLS)           # Creates an empty DataFrame with the correction template's columns and returns it.
       
     # 4) Reset index ONCE so all columns share the same RangeIndex
     df_corr = df_corr.reset_index(drop=True)                           # Creates a new integer index starting from 0.
                                                                        # Dros the old index(instead of turning it into a column).
 
-    # 5) Build a unified participant name column INSIDE df_corr
-    if "participant_name" in df_corr.columns:
-        df_corr["participant_name_final"] = df_corr["participant_name"]
-    elif "full_name" in df_corr.columns:
-        df_corr["participant_name_final"] = df_corr["full_name"]
+    # 5) Resolve the source column for each template column; missing optional
+    #    inputs become all-NA columns (participant_name falls back to full_name).
+    #    One shared all-NA Series serves every missing input.
+    missing = pd.Series(pd.NA, index=df_corr.index, dtype=object)
+    if "participant_name" in present:
+        participant_name = df_corr["participant_name"]
+    elif "full_name" in present:
+        participant_name = df_corr["full_name"]
     else:
-        df_corr["participant_name_final"] = pd.NA
-
-    if "suggested_taxable_amt" not in df_corr.columns:
-        df_corr["suggested_taxable_amt"] = pd.NA
-    if "suggested_first_roth_tax_year" not in df_corr.columns:
-        df_corr["suggested_first_roth_tax_year"] = pd.NA
-
-    if "new_tax_code" not in df_corr.columns:
-        s1 = df_corr.get("suggested_tax_code_1", pd.Series(pd.NA, index=df_corr.index))
-        s2 = df_corr.get("suggested_tax_code_2", pd.Series(pd.NA, index=df_corr.index))
-        s1 = s1.astype("string").str.strip().str.upper().replace("", pd.NA)
-        s2 = s2.astype("string").str.strip().str.upper().replace("", pd.NA)
-        df_corr["new_tax_code"] = pd.NA
-        df_corr.loc[s1.notna() & s2.isna(), "new_tax_code"] = s1
-        df_corr.loc[s1.notna() & s2.notna(), "new_tax_code"] = (s1 + s2)
-        df_corr["new_tax_code"] = df_corr["new_tax_code"].astype("string")
-
-    # 6) Rename columns to the Matrix correction template name
-    # rename_map is a dictionary mapping internal column names -> output column names
-    rename_map = {                                              
-        "transaction_id": "Transaction Id",
-        "txn_date": "Transaction Date",
-        "ssn": "Participant SSN",
-        "participant_name_final": "Participant Name",
-        "matrix_account": "Matrix Account",
-        "tax_code_1": "Current Tax Code 1",
-        "tax_code_2": "Current Tax Code 2",
-        "new_tax_code": "New Tax Code",
-        "suggested_taxable_amt": "New Taxable Amount",
-        "suggested_first_roth_tax_year": "New First Year contrib",
-        "correction_reason": "Reason",
-        "action": "Action",
-    }
-    
-    out = df_corr.rename(columns=rename_map)                           # After this out["Transaction Id"] contains the values originally 
-                                                                       #    in df_corr["transaction_id"].
+        participant_name = missing
 
-    
-    # 7) Keep only the columns we want, in the desired order
-    out = out[out_cols]
+    if "new_tax_code" in present:
+        new_tax_code = df_corr["new_tax_code"]
+    else:
+        s1 = _clean_code_series(df_corr.get("suggested_tax_code_1", missing))
+        s2 = _clean_code_series(df_corr.get("suggested_tax_code_2", missing))
+        # s1 alone when there is no s2; s1 + s2 otherwise (<NA> whenever s1 is missing).
+        new_tax_code = s1.where(s2.isna(), s1 + s2)
+
+    # 6) + 7) Build the Matrix correction template in one construction, in the
+    #    desired column order (no rename pass and no re-selection).
+    #    A missing required input column (e.g. transaction_id) raises KeyError.
+    template_sources = {
+        "Transaction Id": df_corr["transaction_id"],
+        "Transaction Date": df_corr["txn_date"],
+        "Participant SSN": df_corr["ssn"],
+        "Participant Name": participant_name,
+        "Matrix Account": df_corr["matrix_account"],
+        "Current Tax Code 1": df_corr["tax_code_1"],
+        "Current Tax Code 2": df_corr["tax_code_2"],
+        "New Tax Code": new_tax_code,
+        "New Taxable Amount": df_corr.get("suggested_taxable_amt", missing),
+        "New First Year contrib": df_corr.get("suggested_first_roth_tax_year", missing),
+        "Reason": df_corr["correction_reason"],
+        "Action": df_corr["action"],
+    }
+    out = pd.DataFrame(template_sources, columns=_CORRECTION_OUTPUT_COLS)
 
     # 8) Optional: sort for readability (by plan, SSN, txn date)
-    sort_cols = [
-        col for col in ["Matrix Account", "Participant SSN", "Transaction Date"] 
-        if col in out.columns
-    ]
-    if sort_cols:
-        out = out.sort_values(sort_cols)                               # Sorts the rows by sort_columns in ascending order.
+    #    (all three sort columns are always in _CORRECTION_OUTPUT_COLS, and out is never empty here)
+    sort_cols = ["Matrix Account", "Participant SSN", "Transaction Date"]
+    # Sort on integer keys (missing last, like sort_values) with a stable
+    # lexsort, so no object comparisons happen during the sort. Datetime
+    # columns are already integers (ns since epoch) and are used as is;
+    # text columns are ranked through sorted factorize codes.
+    sort_keys = []
+    for col in reversed(sort_cols):                                # np.lexsort: last key is the primary key.
+        values = out[col].to_numpy()
+        if values.dtype.kind == "M":
+            ticks = values.astype("datetime64[ns]").view("i8")
+            sort_keys.append(np.where(np.isnat(values), np.iinfo(np.int64).max, ticks))
+            continue
+        codes, uniques = pd.factorize(out[col], sort=True)
+        sort_keys.append(np.where(codes < 0, len(uniques), codes))
+    out = out.take(np.lexsort(sort_keys))
 
 
     return out.reset_index(drop=True)                                  # Reset index again so rowlablels are 0,1,2... in the final DataFrame you return.
@@ -310,6 +361,7 @@ def write_correction_file(
         corrections_df: pd.DataFrame,
         output_path: Optional[Path | str] = None,
         engine: str | None = None,
+        parquet_companion: bool = False,
 ) -> Path:
     
     """
@@ -327,6 +379,11 @@ def write_correction_file(
             Optional engine name (e.g., match_planid, age_taxcode, roth_taxable).
             When output_path is None, routes output into engine-specific
             subdirectories.
+        parquet_companion:
+            Also write a typed .parquet copy next to the .xlsx for downstream
+            re-loads. Off by default, since it is a second file carrying the
+            same participant data. Skipped when pyarrow is not installed, and
+            a failed Parquet write only warns; the .xlsx is always kept.
 
     Returns:
         Path to the written Excel file.
@@ -353,10 +410,14 @@ def write_correction_file(
         output_path = Path(output_path)                                # Conver it to a Path object for consistent handling.
         output_path.parent.mkdir(parents=True, exist_ok=True)
     
+    # Both tabs are row subsets of corrections_df, so they already carry its
+    # columns in order; stream them straight into the write-only workbook.
     sheets = split_corrections_by_action(corrections_df)
-    columns = list(corrections_df.columns)
-    sheets = {name: df.reindex(columns=columns) for name, df in sheets.items()}
     write_multi_sheet_excel(sheets, output_path, index=False)
+    if parquet_companion:
+        write_parquet_companion(
+            corrections_df, output_path, datetime_cols=["Transaction Date"]
+        )
 
     return output_path                                                 # You return a Path pointing to the saved file.
 
@@ -8,7 +8,9 @@ Design goals
 ------------
 - Low friction: simple entrypoints for single-sheet and multi-sheet exports.
 - Safe output: ensure parent directories exist before writing files.
-- Consistent engine: always use the openpyxl engine for .xlsx output.
+- Consistent engine: always use openpyxl for .xlsx output, in write-only
+  (streaming) mode so rows are flushed to disk instead of held as cell
+  objects for the whole sheet.
 - Notebook-friendly: timestamped filenames for quick iteration.
 
 Public API
@@ -16,19 +18,36 @@ Public API
 - write_df_excel(df, output_path=None, *, out_dir="reports/exports",
   filename_prefix="export", sheet_name="data", index=False) -> Path
 - write_multi_sheet_excel(sheets, output_path, *, index=False) -> Path
+- write_parquet_companion(df, excel_path, *, datetime_cols=()) -> Path | None
 """
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from importlib.util import find_spec
 from pathlib import Path
+from typing import Iterable
+import warnings
 
+import numpy as np
 import pandas as pd
+from pandas.api.types import is_integer_dtype
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, Side
 
 from ..config import REPORTS_DIR, get_engine_outputs_dir
 
 
 EXCEL_SHEETNAME_LIMIT = 31
+# Same header look and date formats pandas' openpyxl writer uses.
+_HEADER_FONT = Font(bold=True)
+_HEADER_BORDER = Border(*(Side(style="thin"),) * 4)
+_HEADER_ALIGNMENT = Alignment(horizontal="center", vertical="top")
+_DATETIME_FORMAT = "YYYY-MM-DD HH:MM:SS"
+_DATE_FORMAT = "YYYY-MM-DD"
+_EXCEL_NATIVE_TYPES = (str, int, float, bool, datetime, date, time, timedelta)
 
 
 def _ensure_parent_dir(path: Path) -> None:
@@ -61,6 +80,111 @@ def _dedupe_sheet_names(names: list[str]) -> list[str]:
     return deduped
 
 
+def _excel_value(value: object) -> object:
+    """
+    Map a cell value to something openpyxl can store.
+
+    Missing -> empty, inf -> 'inf', finite Decimal -> float (non-finite
+    Decimals keep their text form).
+    """
+    if value is None or value is pd.NA or value is pd.NaT:
+        return None
+    if isinstance(value, np.generic):                              # numpy scalars -> Python
+        value = value.item()
+    if isinstance(value, Decimal) and value.is_finite():           # Monetary Decimals land as numbers
+        value = float(value)
+    if isinstance(value, float):
+        if value != value:
+            return None
+        if value in (np.inf, -np.inf):                             # openpyxl would leave the cell empty
+            return "inf" if value > 0 else "-inf"
+    if isinstance(value, _EXCEL_NATIVE_TYPES):
+        return value
+    return str(value)
+
+
+def _date_cell(ws, value: datetime | date, number_format: str | None = None) -> WriteOnlyCell:
+    cell = WriteOnlyCell(ws, value=value)
+    if number_format is None:
+        number_format = _DATETIME_FORMAT if isinstance(value, datetime) else _DATE_FORMAT
+    cell.number_format = number_format
+    return cell
+
+
+def _excel_column(ws, series: pd.Series) -> np.ndarray | list:
+    """
+    Convert one column to openpyxl-ready values, dispatching on dtype once.
+
+    numpy bool/int/float, naive datetime64, pandas string and nullable
+    Int/boolean columns are converted in bulk (Python scalars, missing ->
+    None, +/-inf -> 'inf'/'-inf'); everything else (object and other extension dtypes) goes through
+    _excel_value cell by cell.
+    """
+    dtype = series.dtype
+    if isinstance(dtype, (pd.StringDtype, pd.BooleanDtype)) or (
+        isinstance(dtype, pd.api.extensions.ExtensionDtype) and is_integer_dtype(dtype)
+    ):
+        # Already str/bool/int (or None) once unboxed: nothing left to map.
+        return series.to_numpy(dtype=object, na_value=None)
+    if isinstance(dtype, np.dtype) and dtype.kind in "biuf":
+        values = series.to_numpy()
+        out = values.astype(object)                                # numpy scalars -> Python
+        if dtype.kind == "f":
+            out[np.isnan(values)] = None
+            # Same text pandas' to_excel writes (inf_rep), not an empty cell
+            out[np.isposinf(values)] = "inf"
+            out[np.isneginf(values)] = "-inf"
+        return out
+    if isinstance(dtype, np.dtype) and dtype.kind == "M":
+        missing = series.isna().to_numpy()
+        # Date-only columns (every value at midnight, e.g. cleaned txn_date)
+        # keep the plain date format.
+        values = series.to_numpy()
+        date_only = bool((values[~missing] == values[~missing].astype("datetime64[D]")).all())
+        number_format = _DATE_FORMAT if date_only else _DATETIME_FORMAT
+        stamps = series.to_numpy(dtype=object)
+        return [
+            None if na else _date_cell(ws, ts, number_format)
+            for ts, na in zip(stamps, missing)
+        ]
+
+    out = []
+    for value in series.to_numpy(dtype=object, na_value=None):
+        value = _excel_value(value)
+        if isinstance(value, (datetime, date)):
+            value = _date_cell(ws, value)
+        out.append(value)
+    return out
+
+
+def _write_sheet_streaming(
+    workbook: Workbook,
+    sheet_name: str,
+    df: pd.DataFrame,
+    *,
+    index: bool = False,
+) -> None:
+    """Append df to a write-only workbook as one sheet, one row at a time."""
+    if index:
+        df = df.reset_index()
+    ws = workbook.create_sheet(title=sheet_name)
+
+    header = []
+    for col in df.columns:
+        cell = WriteOnlyCell(ws, value=str(col))
+        cell.font = _HEADER_FONT
+        cell.border = _HEADER_BORDER
+        cell.alignment = _HEADER_ALIGNMENT
+        header.append(cell)
+    ws.append(header)
+
+    # Values are converted column by column, so per-cell work is only the
+    # row append itself.
+    columns = [_excel_column(ws, df.iloc[:, pos]) for pos in range(df.shape[1])]
+    for row in zip(*columns):
+        ws.append(row)
+
+
 def write_df_excel(
     df: pd.DataFrame,
     output_path: Path | str | None = None,
@@ -83,8 +207,7 @@ def write_df_excel(
         output_path = out_dir_path / _timestamped_filename(filename_prefix)
     path = Path(output_path)
     _ensure_parent_dir(path)
-    df.to_excel(path, engine="openpyxl", sheet_name=sheet_name, index=index)
-    return path
+    return write_multi_sheet_excel({sheet_name: df}, path, index=index)
 
 
 def write_multi_sheet_excel(
@@ -101,7 +224,51 @@ def write_multi_sheet_excel(
     path = Path(output_path)
     _ensure_parent_dir(path)
     sheet_names = _dedupe_sheet_names(list(sheets.keys()))
-    with pd.ExcelWriter(path, engine="openpyxl") as writer:
-        for name, sheet_name in zip(sheets.keys(), sheet_names):
-            sheets[name].to_excel(writer, sheet_name=sheet_name, index=index)
+    workbook = Workbook(write_only=True)
+    for name, sheet_name in zip(sheets.keys(), sheet_names):
+        _write_sheet_streaming(workbook, sheet_name, sheets[name], index=index)
+    workbook.save(path)
+    return path
+
+
+def write_parquet_companion(
+    df: pd.DataFrame,
+    excel_path: Path | str,
+    *,
+    datetime_cols: Iterable[str] = (),
+) -> Path | None:
+    """
+    Write df next to excel_path as a zstd-compressed .parquet companion.
+
+    Downstream consumers can load the typed Parquet file instead of re-reading
+    the .xlsx through openpyxl. pyarrow is optional: when it is not installed
+    no file is written and None is returned. Columns in datetime_cols are
+    converted to datetime64 first so they land as Arrow timestamps.
+
+    The companion is best-effort: if Arrow cannot convert a column (e.g. an
+    object column mixing strings and numbers), a warning is issued, any
+    partial file is removed and None is returned.
+    """
+    if find_spec("pyarrow") is None:
+        return None
+    path = Path(excel_path).with_suffix(".parquet")
+    _ensure_parent_dir(path)
+    out = df
+    date_cols = [col for col in datetime_cols if col in df.columns]
+    if date_cols:
+        out = df.assign(
+            **{
+                col: pd.to_datetime(df[col], errors="coerce", cache=True)
+                for col in date_cols
+            }
+        )
+    try:
+        out.to_parquet(path, engine="pyarrow", compression="zstd", index=False)
+    except (TypeError, ValueError, OSError) as exc:           # ArrowTypeError / ArrowInvalid subclass these
+        path.unlink(missing_ok=True)
+        warnings.warn(
+            f"Parquet companion {path.name} was not written: {exc}",
+            stacklevel=2,
+        )
+        return None
     return path
@@ -6,13 +6,19 @@ Helpers for summarizing and visualizing Engine B (age_taxcode_analysis) output.
 
 from __future__ import annotations
 
-from typing import Tuple
+import sys
+from typing import TYPE_CHECKING, Tuple
 
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
+from pandas.api.types import is_datetime64_any_dtype
 
 
 from ..config import MATCH_STATUS_CONFIG
+from ..core.normalizers import match_status_mask
+
+if TYPE_CHECKING:                        # annotations only; matplotlib is imported
+    import matplotlib.pyplot as plt      # lazily by _subplots() when a plot is drawn.
 
 
 STATUS_CFG = MATCH_STATUS_CONFIG
@@ -32,6 +38,36 @@ def _validate_required_columns(df: pd.DataFrame, required_cols: list[str]) -> No
         raise ValueError(f"Missing required columns: {missing_list}")
 
 
+def _subplots(*args, **kwargs):
+    """
+    Create (fig, axes) for a plot_* function.
+
+    Inside an IPython/Jupyter session (or once pyplot is already loaded) this
+    is plt.subplots, so figures still display inline. Batch pipeline runs get a
+    pyplot-free Figure on an Agg canvas instead: no GUI backend negotiation or
+    pyplot global state, and fig.savefig() works the same way.
+    """
+    if "IPython" in sys.modules or "matplotlib.pyplot" in sys.modules:
+        import matplotlib.pyplot as plt
+
+        return plt.subplots(*args, **kwargs)
+
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=kwargs.pop("figsize", None))
+    FigureCanvasAgg(fig)
+    return fig, fig.subplots(*args, **kwargs)
+
+
+def _to_txn_datetime(series: pd.Series) -> pd.Series:
+    """Parse txn_date values, reusing datetime64 columns and caching repeats."""
+    if is_datetime64_any_dtype(series.dtype):
+        return series
+    # cache=True parses each distinct date once; batches repeat the same dates.
+    return pd.to_datetime(series, errors="coerce", cache=True)
+
+
 def build_age_taxcode_metrics(df: pd.DataFrame) -> pd.DataFrame:
     """
     Aggregate monthly totals, correction counts, and correction rate.
@@ -48,25 +84,32 @@ def build_age_taxcode_metrics(df: pd.DataFrame) -> pd.DataFrame:
             columns=["txn_month", "total_txns", "correction_count", "correction_rate"]
         )
 
-    txn_dt = pd.to_datetime(df["txn_date"], errors="coerce")
+    txn_dt = _to_txn_datetime(df["txn_date"])
     invalid_txn_dates = int(txn_dt.isna().sum())
     if invalid_txn_dates:
         raise ValueError(
             f"Found {invalid_txn_dates} rows with missing or malformed txn_date."
         )
 
-    working = df.copy()
-    working["txn_month"] = txn_dt.dt.to_period("M").dt.to_timestamp()
-    working["is_correction"] = working["match_status"] == CORRECTION_STATUS
-
-    metrics = (
-        working.groupby("txn_month", dropna=False)
-        .agg(
-            total_txns=("match_status", "size"),
-            correction_count=("is_correction", "sum"),
-        )
-        .sort_index()
-        .reset_index()
+    # Months are few: factorize the month buffer (as int64 month counts) once
+    # and produce both reductions with np.bincount over the group codes, with
+    # no row sort and no generic groupby/agg dispatch.
+    # datetime64[M] truncation yields month starts without a PeriodArray pass.
+    month_arr = txn_dt.to_numpy(dtype="datetime64[ns]").astype("datetime64[M]")
+    # Plain ndarray mask (missing -> False); no pandas eq/fillna pass.
+    is_correction = match_status_mask(df["match_status"], CORRECTION_STATUS)
+
+    month_codes, month_values = pd.factorize(month_arr.view("int64"), sort=True)
+    months = month_values.astype("datetime64[M]")
+    total_txns = np.bincount(month_codes, minlength=len(months))
+    correction_count = np.bincount(month_codes[is_correction], minlength=len(months))
+
+    metrics = pd.DataFrame(
+        {
+            "txn_month": months.astype("datetime64[ns]"),
+            "total_txns": total_txns,
+            "correction_count": correction_count,
+        }
     )
     metrics["correction_rate"] = (
         metrics["correction_count"] / metrics["total_txns"]
@@ -92,7 +135,7 @@ def build_age_taxcode_kpi_summary(df: pd.DataFrame) -> pd.DataFrame:
     total = int(df.shape[0])
     rows = []
     for group_label, status_value in MATCH_STATUS_GROUPS:
-        count = int((df["match_status"] == status_value).sum())
+        count = int(np.count_nonzero(match_status_mask(df["match_status"], status_value)))
         percent = count / total if total else 0.0
         rows.append(
             {
@@ -114,7 +157,7 @@ def plot_age_taxcode_kpi_summary(
 
     _validate_required_columns(summary_df, ["status_group", "count", "percent"])
 
-    fig, ax = plt.subplots(figsize=(8, 4))
+    fig, ax = _subplots(figsize=(8, 4))
     if summary_df.empty:
         ax.text(0.5, 0.5, "No data available", ha="center", va="center")
         ax.set_axis_off()
@@ -163,7 +206,7 @@ def build_term_date_correction_metrics(df: pd.DataFrame) -> pd.DataFrame:
     working["term_date_group"] = term_dt.notna().map(
         {True: "with_term_date", False: "without_term_date"}
     )
-    working["is_correction"] = working["match_status"] == CORRECTION_STATUS
+    working["is_correction"] = match_status_mask(working["match_status"], CORRECTION_STATUS)
 
     metrics = (
         working.groupby("term_date_group", dropna=False)
@@ -192,7 +235,7 @@ def plot_term_date_correction_rates(
         ["term_date_group", "total_txns", "correction_count", "correction_rate"],
     )
 
-    fig, ax = plt.subplots(figsize=(6, 4))
+    fig, ax = _subplots(figsize=(6, 4))
     if metrics_df.empty:
         ax.text(0.5, 0.5, "No data available", ha="center", va="center")
         ax.set_axis_off()
@@ -239,7 +282,8 @@ def build_correction_reason_crosstab(df: pd.DataFrame) -> pd.DataFrame:
         empty.columns.name = "correction_reason"
         return empty
 
-    corrections = df[df["match_status"] == CORRECTION_STATUS].copy()
+    is_correction = match_status_mask(df["match_status"], CORRECTION_STATUS)
+    corrections = df.iloc[np.flatnonzero(is_correction)]
     if corrections.empty:
         empty = pd.DataFrame()
         empty.index.name = "tax_code_1"
@@ -263,7 +307,7 @@ def plot_correction_reason_crosstab(
     Plot a correction-only tax_code_1 vs correction_reason cross-breakdown.
     """
 
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig, ax = _subplots(figsize=(10, 6))
 
     if crosstab_df.empty:
         ax.text(0.5, 0.5, "No data available", ha="center", va="center")
@@ -305,7 +349,7 @@ def plot_corrections_over_time(
         metrics_df, ["txn_month", "total_txns", "correction_count", "correction_rate"]
     )
 
-    fig, ax_left = plt.subplots(figsize=(10, 5))
+    fig, ax_left = _subplots(figsize=(10, 5))
     ax_right = ax_left.twinx()
 
     if metrics_df.empty:
@@ -332,6 +376,39 @@ def plot_corrections_over_time(
     return fig, (ax_left, ax_right)
 
 
+def _count_labels(series: pd.Series) -> Tuple[list[str], np.ndarray]:
+    """Count values (missing -> "Unknown") via factorize codes + np.bincount.
+
+    Returns labels and counts sorted by count descending; ties keep first
+    appearance order, like value_counts(). Missing values are folded into the
+    "Unknown" bucket from the NA sentinel codes, so no filled copy of the
+    column is materialized.
+    """
+    codes, uniques = pd.factorize(series)
+    uniques = np.asarray(uniques, dtype=object)
+    is_na = codes < 0
+    counts = np.bincount(codes[~is_na], minlength=len(uniques))
+    # Factorize numbers values in appearance order, so the code index is the
+    # tie-break rank; the NA bucket slots in after the last code seen before
+    # its first missing row.
+    ranks = np.arange(len(uniques), dtype=float)
+    if is_na.any():
+        first_na = int(np.argmax(is_na))
+        na_rank = codes[:first_na].max() + 0.5 if first_na else -0.5
+        na_count = int(np.count_nonzero(is_na))
+        known = np.flatnonzero(uniques == "Unknown")
+        if known.size:
+            counts[known[0]] += na_count
+            ranks[known[0]] = min(ranks[known[0]], na_rank)
+        else:
+            uniques = np.append(uniques, "Unknown")
+            counts = np.append(counts, na_count)
+            ranks = np.append(ranks, na_rank)
+    order = np.lexsort((ranks, -counts))
+    labels = [str(label) for label in uniques[order]]
+    return labels, counts[order]
+
+
 def plot_mistake_breakdown(
     df: pd.DataFrame,
 ) -> Tuple[plt.Figure, Tuple[plt.Axes, plt.Axes]]:
@@ -341,7 +418,7 @@ def plot_mistake_breakdown(
 
     _validate_required_columns(df, ["match_status"])
 
-    fig, axes = plt.subplots(1, 2, figsize=(12, 4))
+    fig, axes = _subplots(1, 2, figsize=(12, 4))
     ax_tax, ax_reason = axes
 
     if df.empty:
@@ -350,7 +427,8 @@ def plot_mistake_breakdown(
             ax.set_axis_off()
         return fig, (ax_tax, ax_reason)
 
-    corrections = df[df["match_status"] == CORRECTION_STATUS].copy()
+    is_correction = match_status_mask(df["match_status"], CORRECTION_STATUS)
+    corrections = df.iloc[np.flatnonzero(is_correction)]
     if corrections.empty:
         for ax in axes:
             ax.text(0.5, 0.5, "No corrections to display", ha="center", va="center")
@@ -358,14 +436,8 @@ def plot_mistake_breakdown(
         return fig, (ax_tax, ax_reason)
 
     if "tax_code_1" in corrections.columns:
-        tax_counts = (
-            corrections["tax_code_1"]
-            .fillna("Unknown")
-            .astype("string")
-            .value_counts()
-            .sort_values(ascending=False)
-        )
-        ax_tax.bar(tax_counts.index.astype(str), tax_counts.values, color="#54A24B")
+        tax_labels, tax_values = _count_labels(corrections["tax_code_1"])
+        ax_tax.bar(tax_labels, tax_values, color="#54A24B")
         ax_tax.set_title("Corrections by Tax Code 1")
         ax_tax.set_ylabel("Count")
         ax_tax.set_xlabel("Tax Code 1")
@@ -380,16 +452,10 @@ def plot_mistake_breakdown(
         ax_tax.set_axis_off()
 
     if "correction_reason" in corrections.columns:
-        reason_counts = (
-            corrections["correction_reason"]
-            .fillna("Unknown")
-            .astype("string")
-            .value_counts()
-            .sort_values(ascending=False)
-        )
+        reason_labels, reason_values = _count_labels(corrections["correction_reason"])
         ax_reason.bar(
-            reason_counts.index.astype(str),
-            reason_counts.values,
+            reason_labels,
+            reason_values,
             color="#E45756",
         )
         ax_reason.set_title("Corrections by Reason")
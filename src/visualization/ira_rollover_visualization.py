@@ -125,11 +125,16 @@ def build_ira_rollover_metrics(df: pd.DataFrame) -> pd.DataFrame:
         )
 
     working = df.copy()
-    working["txn_month"] = txn_dt.dt.to_period("M").dt.to_timestamp()
+    # Month start via datetime64[M] truncation (no PeriodArray round-trip).
+    working["txn_month"] = (
+        txn_dt.to_numpy(dtype="datetime64[ns]")
+        .astype("datetime64[M]")
+        .astype("datetime64[ns]")
+    )
     working["is_correction"] = working["match_status"] == STATUS_CFG.needs_correction
 
     metrics = (
-        working.groupby("txn_month", dropna=False)
+        working.groupby("txn_month", dropna=False, sort=False, observed=True)
         .agg(
             total_txns=("match_status", "size"),
             correction_count=("is_correction", "sum"),
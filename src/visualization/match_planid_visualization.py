@@ -358,7 +358,12 @@ def build_correction_reason_trends(df: pd.DataFrame) -> pd.DataFrame:
             f"Found {invalid_count} rows with missing or malformed txn_date."
         )
 
-    corrections["txn_month"] = txn_dt.dt.to_period("M").dt.to_timestamp()
+    # Truncate to month starts in numpy rather than through to_period("M").
+    corrections["txn_month"] = (
+        txn_dt.to_numpy(dtype="datetime64[ns]")
+        .astype("datetime64[M]")
+        .astype("datetime64[ns]")
+    )
     corrections["correction_reason"] = (
         corrections["correction_reason"]
         .fillna("Unknown")
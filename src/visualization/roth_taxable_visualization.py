@@ -309,7 +309,12 @@ def build_roth_correction_reason_trends(df: pd.DataFrame) -> pd.DataFrame:
             f"Found {invalid_count} rows with missing or malformed txn_date."
         )
 
-    working["txn_month"] = txn_dt.dt.to_period("M").dt.to_timestamp()
+    # datetime64[M] cast truncates to the first of the month.
+    working["txn_month"] = (
+        txn_dt.to_numpy(dtype="datetime64[ns]")
+        .astype("datetime64[M]")
+        .astype("datetime64[ns]")
+    )
     reason_df = working.loc[
         working["correction_reason"].notna(), ["txn_month", "correction_reason"]
     ].copy()
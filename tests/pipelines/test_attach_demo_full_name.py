@@ -0,0 +1,58 @@
+import pandas as pd
+
+from src.engines.age_taxcode_analysis import attach_demo_to_matrix
+
+
+def _demo_df() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "plan_id": ["PLAN1", "PLAN1"],
+            "ssn": ["123456780", "123456781"],
+            "dob": ["1960-01-01", "1970-01-01"],
+            "term_date": [pd.NaT, pd.NaT],
+            "first_name": [" Jane ", None],
+            "last_name": ["Doe", None],
+        }
+    )
+
+
+def test_attach_demo_keeps_matrix_participant_name() -> None:
+    matrix_df = pd.DataFrame(
+        {
+            "plan_id": ["PLAN1", "PLAN1"],
+            "ssn": ["123456780", "123456781"],
+            "participant_name": ["Matrix One", "Matrix Two"],
+        }
+    )
+
+    merged = attach_demo_to_matrix(matrix_df, _demo_df())
+
+    assert merged["full_name"].tolist() == ["Matrix One", "Matrix Two"]
+
+
+def test_attach_demo_falls_back_to_relius_names_only_when_missing() -> None:
+    matrix_df = pd.DataFrame(
+        {
+            "plan_id": ["PLAN1", "PLAN1"],
+            "ssn": ["123456780", "123456781"],
+            "participant_name": [None, None],
+        }
+    )
+
+    merged = attach_demo_to_matrix(matrix_df, _demo_df())
+
+    assert merged.loc[0, "full_name"] == "Jane Doe"
+    assert pd.isna(merged.loc[1, "full_name"])
+
+
+def test_attach_demo_drops_time_of_day_from_demo_dates() -> None:
+    matrix_df = pd.DataFrame({"plan_id": ["PLAN1"], "ssn": ["123456780"], "participant_name": ["A"]})
+    demo = _demo_df().assign(
+        dob=["1960-01-01 13:30", "1970-01-01"],
+        term_date=[pd.Timestamp("2024-06-30 17:45"), pd.NaT],
+    )
+
+    merged = attach_demo_to_matrix(matrix_df, demo)
+
+    assert merged.loc[0, "dob"] == pd.Timestamp("1960-01-01")
+    assert merged.loc[0, "term_date"] == pd.Timestamp("2024-06-30")
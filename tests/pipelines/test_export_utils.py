@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from decimal import Decimal
+from importlib.util import find_spec
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from openpyxl import load_workbook
+
+from src.outputs import export_utils
+
+
+def test_write_multi_sheet_excel_round_trips_values(tmp_path: Path) -> None:
+    df = pd.DataFrame(
+        {
+            "Transaction Id": pd.array(["tx1", None], dtype="string"),
+            "Transaction Date": pd.to_datetime(["2025-01-02", None]),
+            "New Taxable Amount": [10.5, float("nan")],
+            "New First Year contrib": pd.array([2020, None], dtype="Int64"),
+            "Gross Amount": [Decimal("1234.56"), Decimal("Infinity")],
+            "Action": ["UPDATE_1099", "INVESTIGATE"],
+        }
+    )
+    long_name = "x" * 40
+
+    path = export_utils.write_multi_sheet_excel(
+        {"UPDATE_1099": df, long_name: df.iloc[:0]},
+        tmp_path / "out" / "corrections.xlsx",
+    )
+
+    sheets = pd.read_excel(path, sheet_name=None)
+    assert list(sheets) == ["UPDATE_1099", "x" * 31]
+    first = sheets["UPDATE_1099"]
+    assert first.columns.tolist() == df.columns.tolist()
+    assert first.loc[0, "Transaction Id"] == "tx1"
+    assert first.loc[0, "Transaction Date"] == pd.Timestamp("2025-01-02")
+    assert first.loc[0, "New First Year contrib"] == 2020
+    assert first.loc[0, "Gross Amount"] == 1234.56
+    ws = load_workbook(path)["UPDATE_1099"]
+    gross_cells = [ws.cell(row=r, column=5).value for r in (2, 3)]
+    assert gross_cells == [1234.56, "Infinity"]                        # Finite Decimal -> number, not text
+    assert first.loc[1, ["Transaction Id", "Transaction Date", "New Taxable Amount"]].isna().all()
+    assert sheets["x" * 31].empty
+
+
+def test_write_multi_sheet_excel_writes_infinite_values_as_text(tmp_path: Path) -> None:
+    df = pd.DataFrame(
+        {
+            "Ratio": [float("inf"), float("-inf"), 1.5],
+            "Mixed": pd.Series([float("inf"), "tx1", float("-inf")], dtype=object),
+        }
+    )
+
+    path = export_utils.write_multi_sheet_excel({"data": df}, tmp_path / "inf.xlsx")
+
+    loaded = pd.read_excel(path, dtype=object)
+    assert loaded["Ratio"].tolist() == ["inf", "-inf", 1.5]
+    assert loaded["Mixed"].tolist() == ["inf", "tx1", "-inf"]
+
+
+def test_write_parquet_companion_matches_pyarrow_availability(tmp_path: Path) -> None:
+    df = pd.DataFrame(
+        {
+            "Transaction Id": ["tx1", "tx2"],
+            "Transaction Date": ["2025-01-02", None],
+        }
+    )
+    excel_path = tmp_path / "corrections.xlsx"
+
+    path = export_utils.write_parquet_companion(
+        df, excel_path, datetime_cols=["Transaction Date"]
+    )
+
+    if find_spec("pyarrow") is None:
+        assert path is None
+        assert not (tmp_path / "corrections.parquet").exists()
+        return
+    assert path == tmp_path / "corrections.parquet"
+    loaded = pd.read_parquet(path)
+    assert loaded["Transaction Date"].dtype.kind == "M"
+    assert loaded.loc[0, "Transaction Date"] == pd.Timestamp("2025-01-02")
+    assert df["Transaction Date"].dtype == object
+
+
+def test_write_parquet_companion_warns_instead_of_failing(tmp_path: Path) -> None:
+    pytest.importorskip("pyarrow")
+    df = pd.DataFrame({"Transaction Id": ["tx1", 2]})                  # Mixed column Arrow cannot type
+    excel_path = tmp_path / "corrections.xlsx"
+
+    with pytest.warns(UserWarning, match="Parquet companion"):
+        path = export_utils.write_parquet_companion(df, excel_path)
+
+    assert path is None
+    assert not (tmp_path / "corrections.parquet").exists()
@@ -0,0 +1,170 @@
+import os
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+import src.core.load_data as load_data
+from src.config import MATRIX_COLUMN_MAP, DateFilterConfig
+
+
+def _write_demo_excel(path: Path, ssn: str) -> None:
+    pd.DataFrame(
+        {
+            "PLANID": ["PLAN1"],
+            "SSNUM": [ssn],
+            "FIRSTNAM": ["Jane"],
+            "LASTNAM": ["Doe"],
+            "BIRTHDATE": ["1970-01-01"],
+            "TERM_DATE": [None],
+        }
+    ).to_excel(path, index=False)
+
+
+def test_load_relius_demo_excel_cache_reuses_and_invalidates(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(load_data, "CACHE_DIR", cache_dir)
+    source = tmp_path / "demo.xlsx"
+    _write_demo_excel(source, "123456780")
+
+    first = load_data.load_relius_demo_excel(source, use_cache=True)
+    cached_files = list(cache_dir.glob("relius_demo_demo_*.pkl"))
+    second = load_data.load_relius_demo_excel(source, use_cache=True)
+
+    assert len(cached_files) == 1
+    pd.testing.assert_frame_equal(first, second)
+
+    _write_demo_excel(source, "98765")
+    refreshed = load_data.load_relius_demo_excel(source, use_cache=True)
+
+    assert str(refreshed.loc[0, "SSNUM"]) == "98765"
+    assert len(list(cache_dir.glob("relius_demo_demo_*.pkl"))) == 1
+
+
+def test_load_relius_demo_excel_rebuilds_truncated_cache_entry(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(load_data, "CACHE_DIR", cache_dir)
+    source = tmp_path / "demo.xlsx"
+    _write_demo_excel(source, "123456780")
+
+    first = load_data.load_relius_demo_excel(source, use_cache=True)
+    (cached,) = cache_dir.glob("relius_demo_demo_*.pkl")
+    cached.write_bytes(cached.read_bytes()[:20])                      # As if the writer was killed mid-write
+
+    rebuilt = load_data.load_relius_demo_excel(source, use_cache=True)
+
+    pd.testing.assert_frame_equal(first, rebuilt)
+    assert pd.read_pickle(cached).equals(first)
+    assert not list(cache_dir.glob("*.tmp"))
+
+
+def test_load_relius_demo_excel_without_cache_writes_nothing(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(load_data, "CACHE_DIR", cache_dir)
+    source = tmp_path / "demo.xlsx"
+    _write_demo_excel(source, "123456780")
+
+    load_data.load_relius_demo_excel(source)
+
+    assert not cache_dir.exists()
+
+
+def test_load_clean_relius_demo_cache_skips_cleaning_on_hit(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    import src.cleaning.clean_relius_demo as clean_relius_demo
+
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(load_data, "CACHE_DIR", cache_dir)
+    source = tmp_path / "demo.xlsx"
+    _write_demo_excel(source, "123456780")
+
+    first = clean_relius_demo.load_clean_relius_demo(source, use_cache=True)
+
+    def _fail(raw_df: pd.DataFrame) -> pd.DataFrame:
+        raise AssertionError("cleaning should be skipped on a cache hit")
+
+    monkeypatch.setattr(clean_relius_demo, "clean_relius_demo", _fail)
+    second = clean_relius_demo.load_clean_relius_demo(source, use_cache=True)
+
+    assert first.loc[first.index[0], "ssn"] == "123456780"
+    assert len(list(cache_dir.glob("relius_demo_clean_demo_*.pkl"))) == 1
+    pd.testing.assert_frame_equal(first, second)
+
+
+def _write_matrix_excel(path: Path, ssn: str) -> None:
+    row = {raw: [None] for raw in MATRIX_COLUMN_MAP}
+    row.update(
+        {
+            "Client Account": ["PLAN1"],
+            "Participant SSN": [ssn],
+            "Gross Amount": [100.0],
+            "Transaction Date": ["2025-01-02"],
+            "Transaction Id": [44324568],
+        }
+    )
+    pd.DataFrame(row).to_excel(path, index=False)
+
+
+def test_load_clean_matrix_cache_skips_cleaning_on_hit(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    import src.cleaning.clean_matrix as clean_matrix_module
+
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(load_data, "CACHE_DIR", cache_dir)
+    source = tmp_path / "matrix.xlsx"
+    _write_matrix_excel(source, "123-45-6780")
+
+    first = clean_matrix_module.load_clean_matrix(source, use_cache=True)
+
+    def _fail(raw_df: pd.DataFrame, **kwargs) -> pd.DataFrame:
+        raise AssertionError("cleaning should be skipped on a cache hit")
+
+    monkeypatch.setattr(clean_matrix_module, "clean_matrix", _fail)
+    second = clean_matrix_module.load_clean_matrix(source, use_cache=True)
+
+    assert first.loc[first.index[0], "ssn"] == "123456780"
+    assert second.attrs["tax_codes_normalized"] is True
+    assert len(list(cache_dir.glob("matrix_clean_matrix_*.pkl"))) == 1
+    pd.testing.assert_frame_equal(first, second)
+
+
+def test_load_clean_matrix_cache_keys_on_date_filter_and_path(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    import src.cleaning.clean_matrix as clean_matrix_module
+
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(load_data, "CACHE_DIR", cache_dir)
+    source = tmp_path / "matrix.xlsx"
+    _write_matrix_excel(source, "123-45-6780")
+
+    unfiltered = clean_matrix_module.load_clean_matrix(source, use_cache=True)
+    february = clean_matrix_module.load_clean_matrix(
+        source,
+        use_cache=True,
+        date_filter=DateFilterConfig(months=(2,)),
+    )
+
+    assert len(unfiltered) == 1
+    assert february.empty
+
+    # Same file name in another folder: its own cache entry, not the first file's
+    other_dir = tmp_path / "other"
+    other_dir.mkdir()
+    other = other_dir / "matrix.xlsx"
+    _write_matrix_excel(other, "987-65-4320")
+    stat = source.stat()
+    os.utime(other, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert other.stat().st_size == stat.st_size
+
+    from_other = clean_matrix_module.load_clean_matrix(other, use_cache=True)
+    assert from_other.loc[from_other.index[0], "ssn"] == "987654320"
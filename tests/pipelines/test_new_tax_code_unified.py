@@ -349,3 +349,169 @@ def test_build_correction_dataframe_exports_taxable_or_year_updates() -> None:
     assert investigate_row["New Taxable Amount"] == 10.0
     assert review_row["New Taxable Amount"] == 5.0
     assert review_row["New First Year contrib"] == 2020
+
+
+def test_build_correction_dataframe_leaves_input_untouched() -> None:
+    matches = pd.DataFrame(
+        {
+            "match_status": ["match_needs_correction", "match_no_action"],
+            "action": ["UPDATE_1099", pd.NA],
+            "transaction_id": ["tx6", "tx7"],
+            "txn_date": [pd.Timestamp("2025-06-01"), pd.Timestamp("2025-06-02")],
+            "ssn": ["123456780", "123456781"],
+            "participant_name": ["Alex", "Sam"],
+            "matrix_account": ["acct6", "acct7"],
+            "tax_code_1": ["7", "7"],
+            "tax_code_2": ["", ""],
+            "suggested_tax_code_1": ["1", pd.NA],
+            "correction_reason": ["age_rule", pd.NA],
+        }
+    )
+    snapshot = matches.copy()
+
+    corrections_df = build_correction_dataframe(matches)
+
+    assert corrections_df["Transaction Id"].tolist() == ["tx6"]
+    pd.testing.assert_frame_equal(matches, snapshot)
+
+
+def test_build_correction_dataframe_filters_repeated_and_missing_actions() -> None:
+    matches = pd.DataFrame(
+        {
+            "match_status": ["match_needs_correction"] * 4,
+            "action": ["update_1099", pd.NA, "INVESTIGATE", "update_1099"],
+            "transaction_id": ["tx1", "tx2", "tx3", "tx4"],
+            "txn_date": pd.to_datetime(
+                ["2025-06-01", "2025-06-02", "2025-06-03", "2025-06-04"]
+            ),
+            "ssn": ["123456780", "123456781", "123456782", "123456783"],
+            "participant_name": ["A", "B", "C", "D"],
+            "matrix_account": ["acct1", "acct2", "acct3", "acct4"],
+            "tax_code_1": ["7", "7", "7", "7"],
+            "tax_code_2": ["", "", "", ""],
+            "suggested_tax_code_1": ["1", "1", "1", "1"],
+            "correction_reason": ["r1", "r2", "r3", "r4"],
+        }
+    )
+
+    corrections_df = build_correction_dataframe(
+        matches, allowed_actions=("UPDATE_1099",)
+    )
+
+    assert corrections_df["Transaction Id"].tolist() == ["tx1", "tx4"]
+
+
+def test_build_correction_dataframe_accepts_categorical_match_status() -> None:
+    matches = pd.DataFrame(
+        {
+            "match_status": pd.Categorical(
+                ["match_needs_correction", "match_no_action", pd.NA, "match_needs_review"],
+                categories=["match_no_action", "match_needs_correction", "match_needs_review"],
+            ),
+            "action": ["UPDATE_1099"] * 4,
+            "transaction_id": ["tx1", "tx2", "tx3", "tx4"],
+            "txn_date": pd.to_datetime(
+                ["2025-06-01", "2025-06-02", "2025-06-03", "2025-06-04"]
+            ),
+            "ssn": ["123456780", "123456781", "123456782", "123456783"],
+            "participant_name": ["A", "B", "C", "D"],
+            "matrix_account": ["acct1", "acct2", "acct3", "acct4"],
+            "tax_code_1": ["7", "7", "7", "7"],
+            "tax_code_2": ["", "", "", ""],
+            "suggested_tax_code_1": ["1", "1", "1", "1"],
+            "correction_reason": ["r1", "r2", "r3", "r4"],
+        }
+    )
+
+    categorical = build_correction_dataframe(matches)
+    plain = build_correction_dataframe(
+        matches.assign(match_status=matches["match_status"].astype(object))
+    )
+
+    assert categorical["Transaction Id"].tolist() == ["tx1", "tx4"]
+    pd.testing.assert_frame_equal(categorical, plain)
+
+
+def test_build_correction_dataframe_treats_missing_tolerance_as_out_of_range() -> None:
+    matches = pd.DataFrame(
+        {
+            "match_status": ["match_needs_correction"] * 4,
+            "action": ["UPDATE_1099"] * 4,
+            "_merge": pd.Categorical(
+                ["both", "both", "both", "left_only"],
+                categories=["left_only", "right_only", "both"],
+            ),
+            "date_within_tolerance": pd.array([True, pd.NA, False, True], dtype="boolean"),
+            "transaction_id": ["tx1", "tx2", "tx3", "tx4"],
+            "txn_date": pd.to_datetime(
+                ["2025-06-01", "2025-06-02", "2025-06-03", "2025-06-04"]
+            ),
+            "ssn": ["123456780", "123456781", "123456782", "123456783"],
+            "participant_name": ["A", "B", "C", "D"],
+            "matrix_account": ["acct1", "acct2", "acct3", "acct4"],
+            "tax_code_1": ["7", "7", "7", "7"],
+            "tax_code_2": ["", "", "", ""],
+            "suggested_tax_code_1": ["1", "1", "1", "1"],
+            "correction_reason": ["r1", "r2", "r3", "r4"],
+        }
+    )
+
+    corrections_df = build_correction_dataframe(matches)
+
+    assert corrections_df["Transaction Id"].tolist() == ["tx1"]
+
+
+def test_build_correction_dataframe_sorts_like_sort_values() -> None:
+    matches = pd.DataFrame(
+        {
+            "match_status": ["match_needs_correction"] * 5,
+            "action": ["UPDATE_1099"] * 5,
+            "transaction_id": ["tx1", "tx2", "tx3", "tx4", "tx5"],
+            "txn_date": pd.to_datetime(
+                ["2025-06-03", None, "2025-06-01", "2025-06-02", "2025-06-01"]
+            ),
+            "ssn": ["123456781", "123456780", "123456780", "123456780", pd.NA],
+            "participant_name": ["A", "B", "C", "D", "E"],
+            "matrix_account": ["acct2", "acct1", "acct1", "acct1", "acct1"],
+            "tax_code_1": ["7"] * 5,
+            "tax_code_2": [""] * 5,
+            "suggested_tax_code_1": ["1"] * 5,
+            "correction_reason": ["r1", "r2", "r3", "r4", "r5"],
+        }
+    )
+
+    corrections_df = build_correction_dataframe(matches)
+    expected = corrections_df.sort_values(
+        ["Matrix Account", "Participant SSN", "Transaction Date"], kind="stable"
+    )
+
+    assert corrections_df["Transaction Id"].tolist() == ["tx3", "tx4", "tx2", "tx5", "tx1"]
+    assert expected["Transaction Id"].tolist() == corrections_df["Transaction Id"].tolist()
+
+
+def test_build_correction_dataframe_returns_template_when_nothing_to_correct() -> None:
+    matches = pd.DataFrame(
+        {
+            "match_status": ["match_no_action", "match_needs_correction"],
+            "action": ["NO_ACTION", "UPDATE_1099"],
+            "suggested_tax_code_1": ["1", pd.NA],
+        }
+    )
+
+    corrections_df = build_correction_dataframe(matches)
+
+    assert corrections_df.empty
+    assert corrections_df.columns.tolist() == [
+        "Transaction Id",
+        "Transaction Date",
+        "Participant SSN",
+        "Participant Name",
+        "Matrix Account",
+        "Current Tax Code 1",
+        "Current Tax Code 2",
+        "New Tax Code",
+        "New Taxable Amount",
+        "New First Year contrib",
+        "Reason",
+        "Action",
+    ]
@@ -0,0 +1,22 @@
+import pandas as pd
+
+from src.cleaning.clean_relius_roth_basis import clean_relius_roth_basis
+
+
+def test_clean_relius_roth_basis_keeps_most_complete_row_per_key() -> None:
+    raw_df = pd.DataFrame(
+        {
+            "PLANID": ["PLAN1", "PLAN1", "PLAN1", "PLAN2", "PLAN2"],
+            "SSNUM": ["123456780", "123456780", "123456780", "123456780", "123456780"],
+            "FIRSTNAM": ["A", "B", "C", "D", "E"],
+            "LASTNAM": ["Doe"] * 5,
+            "FIRSTTAXYEARROTH": [None, 2015, 2016, None, None],
+            "Total": [100.0, 200.0, 300.0, None, 50.0],
+        }
+    )
+
+    cleaned = clean_relius_roth_basis(raw_df)
+
+    # Most complete first; ties keep file order (B before C, E over D).
+    assert cleaned["first_name"].tolist() == ["B", "E"]
+    assert cleaned.index.tolist() == [1, 4]
@@ -4,8 +4,12 @@ from src.config import ROTH_TAXABLE_CONFIG
 from src.core.normalizers import (
     _append_action,
     _append_reason,
+    _compute_age_years,
+    _compute_ages_both,
     _compute_start_year,
     _is_roth_plan,
+    attained_age_by_year_end,
+    split_corrections_by_action,
 )
 
 
@@ -72,3 +76,61 @@ def test_compute_start_year_prefers_first_and_keeps_missing() -> None:
     expected.name = "first_roth_tax_year"
 
     pd.testing.assert_series_equal(start_year, expected)
+
+
+def test_compute_age_years_uses_year_component_and_keeps_missing() -> None:
+    dob = pd.to_datetime(pd.Series(["1970-12-31", "1980-01-01", None]))
+    asof = pd.to_datetime(pd.Series(["2025-01-01", None, "2025-01-01"]))
+
+    ages = _compute_age_years(dob, asof)
+
+    assert ages.dtype == "float64"
+    assert ages.iloc[0] == 55.0
+    assert ages.iloc[1:].isna().all()
+
+
+def test_attained_age_by_year_end_year_boundaries_and_missing() -> None:
+    dob = pd.to_datetime(
+        pd.Series(["1965-06-30", "1965-07-01", "1960-02-29", None, "1965-01-01"])
+    )
+    year = pd.Series([2024, 2024, 2019, 2024, None])
+
+    attained = attained_age_by_year_end(dob, year, years=59, months=6)
+
+    assert attained.dtype == bool
+    assert attained.tolist() == [True, False, True, False, False]
+
+
+def test_compute_ages_both_matches_single_age_helper() -> None:
+    dob = pd.to_datetime(pd.Series(["1970-12-31", None, "1960-06-01"]))
+    txn = pd.to_datetime(pd.Series(["2025-01-01", "2025-01-01", None]))
+    term = pd.to_datetime(pd.Series([None, "2020-05-05", "2015-06-01"]))
+
+    age_txn, age_term = _compute_ages_both(dob, txn, term)
+
+    pd.testing.assert_series_equal(age_txn, _compute_age_years(dob, txn))
+    pd.testing.assert_series_equal(age_term, _compute_age_years(dob, term))
+
+
+def test_split_corrections_by_action_duplicates_multi_action_rows() -> None:
+    corrections_df = pd.DataFrame(
+        {
+            "Transaction Id": ["tx1", "tx2", "tx3", "tx4", "tx5"],
+            "Action": [
+                "UPDATE_1099",
+                " update_1099 \nINVESTIGATE",
+                "INVESTIGATE",
+                pd.NA,
+                "UPDATE_1099",
+            ],
+        },
+        index=[10, 11, 12, 13, 14],
+    )
+
+    sheets = split_corrections_by_action(corrections_df)
+
+    assert sheets["Correction"]["Transaction Id"].tolist() == ["tx1", "tx2", "tx5"]
+    assert sheets["Investigate"]["Transaction Id"].tolist() == ["tx2", "tx3"]
+    assert set(sheets["Correction"]["Action"]) == {"UPDATE_1099"}
+    assert set(sheets["Investigate"]["Action"]) == {"INVESTIGATE"}
+    assert corrections_df.loc[11, "Action"] == " update_1099 \nINVESTIGATE"
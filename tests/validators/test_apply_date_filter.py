@@ -36,3 +36,23 @@ def test_apply_date_filter_tz_aware_inclusive_end_date() -> None:
 
     assert result.shape[0] == 1
     assert result.iloc[0]["txn_date"] == pd.Timestamp("2025-01-31 15:00:00", tz="UTC")
+
+
+def test_apply_date_filter_months_skips_missing_dates() -> None:
+    df = pd.DataFrame(
+        {
+            "txn_date": [
+                pd.Timestamp("2024-07-15"),
+                pd.NaT,
+                pd.Timestamp("2025-08-01"),
+                pd.Timestamp("2025-07-31 23:59:00"),
+            ],
+            "row": [1, 2, 3, 4],
+        }
+    )
+
+    date_filter = DateFilterConfig(months=["July"])
+    result = apply_date_filter(df, "txn_date", date_filter=date_filter)
+
+    assert result["row"].tolist() == [1, 4]
+    assert result.index.tolist() == [0, 3]
@@ -1,6 +1,10 @@
 import pandas as pd
 
-from src.cleaning.clean_matrix import clean_matrix
+from src.cleaning.clean_matrix import (
+    _normalize_transaction_id_series,
+    clean_matrix,
+    clean_matrix_chunks,
+)
 from src.config import DateFilterConfig
 
 
@@ -34,6 +38,7 @@ def test_clean_matrix_cross_field_issue_added() -> None:
     assert cleaned["validation_issues"].tolist() == [
         ["cross_code_g_taxable_over_10pct"],
     ]
+    assert cleaned.attrs.get("tax_codes_normalized") is True
 
 
 def test_clean_matrix_missing_txn_date_skips_date_filter() -> None:
@@ -96,3 +101,219 @@ def test_clean_matrix_preserves_string_transaction_id() -> None:
     cleaned = clean_matrix(raw_df, drop_rows_missing_keys=False)
 
     assert cleaned.loc[0, "transaction_id"] == "44324568"
+
+
+def test_clean_matrix_normalizes_mixed_transaction_ids() -> None:
+    raw_df = pd.DataFrame(
+        {
+            "Transaction Id": [
+                44324568.0, "44324569.0", " 4432-4570 ", " 0044324571 ", "TX44", 1.5, None, "  ",
+            ],
+            "Transaction Date": ["2025-01-01"] * 8,
+            "Client Account": ["PLAN1"] * 8,
+            "Participant SSN": ["123456780"] * 8,
+            "Gross Amount": [100.0, 101.0, 102.0, 103.0, 104.0, 105.0, 106.0, 107.0],
+        }
+    )
+
+    cleaned = clean_matrix(raw_df, drop_rows_missing_keys=False)
+
+    assert cleaned["transaction_id"].tolist()[:4] == [
+        "44324568", "44324569", "44324570", "0044324571",
+    ]
+    assert cleaned["transaction_id"].iloc[4:].isna().all()
+
+
+def test_clean_matrix_leaves_raw_frame_untouched() -> None:
+    raw_df = pd.DataFrame(
+        {
+            "Transaction Id": [44324568.0, 44324569.0],
+            "Transaction Date": ["2025-01-01", "2025-01-02"],
+            "Client Account": [" plan1 ", "PLAN2"],
+            "Participant SSN": ["123-45-6780", 123456781],
+            "Gross Amount": ["100.0", 200.0],
+            "Tax Code 1": ["7 - Normal", "G - Rollover"],
+            "Unmapped Column": ["x", "y"],
+        }
+    )
+    snapshot = raw_df.copy()
+
+    cleaned = clean_matrix(raw_df, drop_rows_missing_keys=False)
+
+    assert "Unmapped Column" not in cleaned.columns
+    assert cleaned["ssn"].tolist() == ["123456780", "123456781"]
+    pd.testing.assert_frame_equal(raw_df, snapshot)
+
+
+def test_clean_matrix_drops_duplicate_match_keys_keeping_first() -> None:
+    raw_df = pd.DataFrame(
+        {
+            "Transaction Id": ["1", "2", "3", "4", "5"],
+            "Transaction Date": ["2025-01-01", "2025-01-01", "2025-01-02", None, None],
+            "Client Account": ["PLAN1"] * 5,
+            "Participant SSN": ["123456780"] * 5,
+            "Gross Amount": [100.0, 100.0, 100.0, 100.0, 100.0],
+        }
+    )
+
+    cleaned = clean_matrix(raw_df, drop_rows_missing_keys=False)
+
+    assert cleaned["transaction_id"].tolist() == ["1", "3", "4"]
+
+    cleaned = clean_matrix(raw_df, drop_rows_missing_keys=True)
+
+    assert cleaned["transaction_id"].tolist() == ["1", "3"]
+    assert cleaned.index.tolist() == [0, 2]
+
+
+def test_clean_matrix_parses_txn_date_to_midnight_datetime64() -> None:
+    raw_df = pd.DataFrame(
+        {
+            "Transaction Id": ["1", "2", "3"],
+            "Transaction Date": ["2025-01-02", "01/03/2025 10:30", None],
+            "Client Account": ["PLAN1"] * 3,
+            "Participant SSN": ["123456780"] * 3,
+            "Gross Amount": [100.0, 101.0, 102.0],
+        }
+    )
+    iso_only = raw_df.assign(**{"Transaction Date": ["2025-01-02", "2025-01-03", None]})
+
+    for frame in (raw_df, iso_only):
+        cleaned = clean_matrix(frame, drop_rows_missing_keys=False)
+
+        assert cleaned["txn_date"].dtype == "datetime64[ns]"
+        assert cleaned["txn_date"].iloc[0] == pd.Timestamp("2025-01-02")
+        assert pd.isna(cleaned["txn_date"].iloc[2])
+    assert clean_matrix(iso_only, drop_rows_missing_keys=False)["txn_date"].iloc[1] == pd.Timestamp("2025-01-03")
+
+
+def test_clean_matrix_stores_descriptive_text_as_category() -> None:
+    raw_df = pd.DataFrame(
+        {
+            "Transaction Id": ["1", "2", "3"],
+            "Transaction Date": ["2025-01-02"] * 3,
+            "Client Account": ["PLAN1"] * 3,
+            "Participant SSN": ["123456780"] * 3,
+            "Participant State": [" ca", "CA ", None],
+            "Gross Amount": [100.0, 101.0, 102.0],
+            "Transaction Type": [" ACH", "Check", "ACH "],
+            "Tax Code": ["7", "G", "7"],
+        }
+    )
+
+    cleaned = clean_matrix(raw_df, drop_rows_missing_keys=False)
+
+    assert isinstance(cleaned["state"].dtype, pd.CategoricalDtype)
+    assert isinstance(cleaned["txn_method"].dtype, pd.CategoricalDtype)
+    assert cleaned["state"].tolist()[:2] == ["CA", "CA"]
+    assert pd.isna(cleaned["state"].iloc[2])
+    assert cleaned["txn_method"].tolist() == ["ACH", "Check", "ACH"]
+    assert cleaned["tax_code_1"].dtype == "string"
+
+
+def test_clean_matrix_filters_ignored_accounts_and_txn_methods() -> None:
+    raw_df = pd.DataFrame(
+        {
+            "Matrix Account": ["07B00442", "07A0001", None, "07A0001", "07A0001"],
+            "Transaction Id": ["1", "2", "3", "4", "5"],
+            "Transaction Date": ["2025-01-02"] * 5,
+            "Client Account": ["PLAN1"] * 5,
+            "Participant SSN": ["123456780"] * 5,
+            "Gross Amount": [100.0, 101.0, 102.0, 103.0, 104.0],
+            "Transaction Type": ["ACH", " Account Transfer ", "ACH", None, "CHECK STOP"],
+        }
+    )
+
+    cleaned = clean_matrix(raw_df, drop_rows_missing_keys=False)
+
+    assert cleaned["transaction_id"].tolist() == ["3", "4"]
+    assert isinstance(cleaned["matrix_account"].dtype, pd.CategoricalDtype)
+    assert cleaned["matrix_account"].cat.categories.tolist() == ["07A0001"]
+
+
+def test_clean_matrix_chunks_matches_whole_frame_clean() -> None:
+    raw_df = pd.DataFrame(
+        {
+            "Transaction Id": ["1", "2", "3", "4", "5", "6"],
+            "Transaction Date": ["2025-01-02"] * 6,
+            "Client Account": ["PLAN1", "PLAN1", "PLAN2", "PLAN1", "PLAN2", None],
+            "Participant SSN": ["123456780"] * 6,
+            "Gross Amount": [100.0, 100.0, 200.0, 100.0, 300.0, 400.0],
+            "Transaction Type": ["ACH"] * 6,
+        }
+    )
+
+    whole = clean_matrix(raw_df)
+    chunks = list(clean_matrix_chunks(raw_df.iloc[i:i + 2] for i in range(0, 6, 2)))
+
+    assert [len(chunk) for chunk in chunks] == [1, 1, 1]
+    streamed = pd.concat(chunks)
+    assert streamed["transaction_id"].tolist() == whole["transaction_id"].tolist() == ["1", "3", "5"]
+
+
+def test_clean_matrix_float_transaction_ids() -> None:
+    raw_df = pd.DataFrame(
+        {
+            "Transaction Id": [44324568.0, float("nan"), 12.5, 44324560.0],
+            "Transaction Date": ["2025-01-02"] * 4,
+            "Client Account": ["PLAN1"] * 4,
+            "Participant SSN": ["123456780"] * 4,
+            "Gross Amount": [100.0, 101.0, 102.0, 103.0],
+        }
+    )
+
+    cleaned = clean_matrix(raw_df, drop_rows_missing_keys=False)
+
+    assert cleaned["transaction_id"].dtype == "string"
+    assert cleaned["transaction_id"].iloc[[0, 3]].tolist() == ["44324568", "44324560"]
+    assert cleaned["transaction_id"].iloc[1:3].isna().all()
+
+
+def test_clean_matrix_large_integer_transaction_ids_keep_every_digit() -> None:
+    base = {
+        "Transaction Date": ["2025-01-02"] * 3,
+        "Client Account": ["PLAN1"] * 3,
+        "Participant SSN": ["123456780"] * 3,
+        "Gross Amount": [100.0, 101.0, 102.0],
+    }
+    int_ids = pd.Series([12345678901234567, pd.NA, 2**62 + 1], dtype="Int64")
+    mixed_ids = [2**64 + 1, "44324569", 1e19]
+
+    from_ints = clean_matrix(pd.DataFrame({"Transaction Id": int_ids, **base}), drop_rows_missing_keys=False)
+    from_mixed = clean_matrix(pd.DataFrame({"Transaction Id": mixed_ids, **base}), drop_rows_missing_keys=False)
+
+    assert from_ints["transaction_id"].iloc[[0, 2]].tolist() == ["12345678901234567", str(2**62 + 1)]
+    assert pd.isna(from_ints["transaction_id"].iloc[1])
+    assert from_mixed["transaction_id"].tolist() == [str(2**64 + 1), "44324569", "10000000000000000000"]
+
+
+def test_normalize_transaction_ids_with_duplicate_index_labels() -> None:
+    series = pd.Series([44324568, "TX-1", "A12", " 4432-4570 ", "  "], index=[0, 0, 1, 1, 2], dtype=object)
+
+    result = _normalize_transaction_id_series(series)
+
+    assert result.index.tolist() == [0, 0, 1, 1, 2]
+    assert result.iloc[[0, 3]].tolist() == ["44324568", "44324570"]
+    assert result.iloc[[1, 2, 4]].isna().all()
+
+
+def test_clean_matrix_chunks_matches_whole_frame_with_missing_keys() -> None:
+    raw_df = pd.DataFrame(
+        {
+            "Transaction Id": ["1", "2", "3", "4", "5", "6"],
+            "Transaction Date": ["2025-01-02"] * 6,
+            "Client Account": ["PLAN1"] * 6,
+            "Participant SSN": ["123456780"] * 6,
+            "Gross Amount": [float("nan"), 100.0, float("nan"), 100.0, 200.0, float("nan")],
+            "Transaction Type": ["ACH"] * 6,
+        }
+    )
+
+    whole = clean_matrix(raw_df, drop_rows_missing_keys=False)
+    chunks = clean_matrix_chunks(
+        (raw_df.iloc[i:i + 2] for i in range(0, 6, 2)),
+        drop_rows_missing_keys=False,
+    )
+    streamed = pd.concat(list(chunks))
+
+    assert streamed["transaction_id"].tolist() == whole["transaction_id"].tolist() == ["1", "2", "5"]
@@ -1,6 +1,7 @@
 import pandas as pd
 
 from src.cleaning.clean_relius import clean_relius
+from src.cleaning.clean_relius_demo import clean_relius_demo
 from src.config import DateFilterConfig
 
 
@@ -53,3 +54,62 @@ def test_clean_relius_missing_exported_date_skips_date_filter() -> None:
     assert cleaned.shape[0] == 1
     assert "exported_date" not in cleaned.columns
     assert cleaned["date_valid"].isna().all()
+
+
+def test_clean_relius_parses_exported_date_to_midnight_datetime64() -> None:
+    raw_df = pd.DataFrame(
+        {
+            "PLANID_1": ["PLAN1", "PLAN1"],
+            "SSNUM_1": ["123456780", "123456781"],
+            "GROSSDISTRAMT": [1000.0, 2000.0],
+            "EXPORTEDDATE": ["2020-01-01", None],
+            "DISTRNAM": ["Rollover", "Cash"],
+        }
+    )
+
+    cleaned = clean_relius(raw_df, drop_rows_missing_keys=False)
+
+    assert cleaned["exported_date"].dtype == "datetime64[ns]"
+    assert cleaned["exported_date"].iloc[0] == pd.Timestamp("2020-01-01")
+    assert pd.isna(cleaned["exported_date"].iloc[1])
+
+
+def test_clean_relius_classifies_repeated_dist_names() -> None:
+    raw_df = pd.DataFrame(
+        {
+            "PLANID_1": ["PLAN1"] * 4,
+            "SSNUM_1": ["123456780", "123456781", "123456782", "123456783"],
+            "GROSSDISTRAMT": [1000.0, 2000.0, 3000.0, 4000.0],
+            "EXPORTEDDATE": ["2020-01-01"] * 4,
+            "DISTRNAM": ["Rollover", None, " Partial Rollover - Net", "Rollover"],
+        }
+    )
+
+    cleaned = clean_relius(raw_df, drop_rows_missing_keys=False)
+
+    assert cleaned["dist_category_relius"].tolist() == [
+        "rollover",
+        "other",
+        "partial_rollover",
+        "rollover",
+    ]
+
+
+def test_clean_relius_demo_parses_dates_to_midnight() -> None:
+    raw_df = pd.DataFrame(
+        {
+            "PLANID": ["PLAN1", "PLAN1"],
+            "SSNUM": ["123456780", "123456781"],
+            "FIRSTNAM": ["Jane", "Jim"],
+            "LASTNAM": ["Doe", "Doe"],
+            "BIRTHDATE": [pd.Timestamp("1960-01-01 13:30"), None],
+            "TERM_DATE": [None, pd.Timestamp("2024-06-30 17:45")],
+        }
+    )
+
+    cleaned = clean_relius_demo(raw_df)
+
+    assert cleaned["dob"].dtype == "datetime64[ns]"
+    assert cleaned.loc[0, "dob"] == pd.Timestamp("1960-01-01")
+    assert cleaned.loc[1, "term_date"] == pd.Timestamp("2024-06-30")
+    assert cleaned.loc[1, "dob"] is pd.NaT
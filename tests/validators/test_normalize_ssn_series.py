@@ -0,0 +1,82 @@
+import numpy as np
+import pandas as pd
+
+from src.core.normalizers import normalize_ssn, normalize_ssn_series
+
+
+def test_normalize_ssn_series_matches_scalar_helper() -> None:
+    values = [
+        123456789,
+        1234567,
+        123456789.0,
+        123.5,
+        "123-45-6789",
+        " 123456789.0 ",
+        "1234567",
+        "abc",
+        "",
+        "12345678901",
+        "12.0",
+        "123.00",
+        "1-2.0",
+        -1,
+        -1.0,
+        1234567890,
+        1e9,
+        None,
+        np.nan,
+    ]
+    series = pd.Series(values, dtype=object)
+
+    result = normalize_ssn_series(series)
+
+    expected = pd.Series([normalize_ssn(v) for v in values], dtype="string")
+    assert result.dtype == "string"
+    pd.testing.assert_series_equal(result, expected)
+
+
+def test_normalize_ssn_series_numeric_dtypes() -> None:
+    ints = normalize_ssn_series(pd.Series([123456789, 12], dtype="int64"))
+    floats = normalize_ssn_series(pd.Series([123456780.0, np.nan, 1.5]))
+
+    assert ints.tolist() == ["123456789", "000000012"]
+    assert floats.iloc[0] == "123456780"
+    assert floats.iloc[1:].isna().all()
+
+
+def test_normalize_ssn_series_numeric_bounds() -> None:
+    result = normalize_ssn_series(pd.Series([0.0, 999999999.0, 1e9, -1.0]))
+
+    assert result.tolist()[:2] == ["000000000", "999999999"]
+    assert result.iloc[2:].isna().all()
+
+
+def test_normalize_ssn_series_rejects_more_than_nine_digits() -> None:
+    result = normalize_ssn_series(pd.Series([1234567890, "1234567890"], dtype=object))
+
+    assert result.isna().all()
+
+
+def test_normalize_ssn_series_repeated_values_keep_index() -> None:
+    series = pd.Series(
+        ["123-45-6789", 1234567, "123-45-6789", None, 1234567],
+        index=[10, 11, 12, 13, 14],
+        dtype=object,
+    )
+
+    result = normalize_ssn_series(series)
+
+    assert result.index.tolist() == [10, 11, 12, 13, 14]
+    assert result.dtype == "string"
+    assert result.tolist()[:3] == ["123456789", "001234567", "123456789"]
+    assert result.iloc[3] is pd.NA
+    assert result.iloc[4] == "001234567"
+
+
+def test_normalize_ssn_series_duplicate_index_labels() -> None:
+    series = pd.Series(["123-45-6789", 987654321, " 1234567 "], index=[0, 0, 1], dtype=object)
+
+    result = normalize_ssn_series(series)
+
+    assert result.index.tolist() == [0, 0, 1]
+    assert result.tolist() == ["123456789", "987654321", "001234567"]
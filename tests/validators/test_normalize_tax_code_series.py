@@ -0,0 +1,32 @@
+import numpy as np
+import pandas as pd
+
+from src.core.normalizers import normalize_tax_code_series
+
+
+def test_normalize_tax_code_series_extracts_leading_codes() -> None:
+    series = pd.Series(
+        ["7 - Normal Distributions", " g - Rollover", "11 - Loan", "", "#", None, np.nan, 7],
+        dtype=object,
+    )
+
+    result = normalize_tax_code_series(series)
+
+    expected = pd.Series(
+        ["7", "G", "11", pd.NA, pd.NA, pd.NA, pd.NA, "7"], dtype="string"
+    )
+    pd.testing.assert_series_equal(result, expected)
+
+
+def test_normalize_tax_code_series_repeated_values_keep_index() -> None:
+    series = pd.Series(
+        ["7 - Normal", "G - Rollover", None, "7 - Normal", "G - Rollover"],
+        index=[40, 10, 30, 20, 50],
+    )
+
+    result = normalize_tax_code_series(series)
+
+    expected = pd.Series(
+        ["7", "G", pd.NA, "7", "G"], index=[40, 10, 30, 20, 50], dtype="string"
+    )
+    pd.testing.assert_series_equal(result, expected)
@@ -27,6 +27,18 @@ def test_validate_ssn_series() -> None:
     assert result.tolist() == [True, False, False]
 
 
+def test_validate_ssn_series_repeated_values_keep_index() -> None:
+    series = pd.Series(
+        ["123456780", pd.NA, "123456780", "666123456"],
+        index=[7, 8, 9, 10],
+        dtype="string",
+    )
+    result = validate_ssn_series(series)
+    assert result.dtype == "boolean"
+    assert result.index.tolist() == [7, 8, 9, 10]
+    assert result.tolist() == [True, False, True, False]
+
+
 def test_validate_amounts_series_rules() -> None:
     gross = pd.Series([1000.0, -50.0, 50.0, 20.0])
     taxable = pd.Series([500.0, 10.0, -5.0, 200.0])
@@ -90,3 +102,29 @@ def test_cross_validation_and_issue_builder() -> None:
         ["ssn_invalid", "cross_taxable_exceeds_gross_150pct"],
         ["amount_invalid", "cross_code1_age_over_59_5"],
     ]
+
+
+def test_build_validation_issues_orders_flags_and_ignores_missing() -> None:
+    ssn_valid = pd.Series([False, pd.NA, True], dtype="boolean")
+    amount_valid = pd.Series([False, True, True], dtype="boolean")
+    date_valid = pd.Series([True, pd.NA, True], dtype="boolean")
+    code_valid = pd.Series([False, True, True], dtype="boolean")
+
+    issues = build_validation_issues(ssn_valid, amount_valid, date_valid, code_valid)
+
+    assert issues.tolist() == [["ssn_invalid", "amount_invalid", "code_1099r_invalid"], [], []]
+
+
+def test_build_validation_issues_skips_missing_cross_field_entries() -> None:
+    flag = pd.Series([True, False, True], index=[10, 11, 12], dtype="boolean")
+    cross_issues = pd.Series(
+        [None, ["cross_code_g_taxable_over_10pct"], float("nan")], index=[10, 11, 12], dtype=object
+    )
+
+    issues = build_validation_issues(flag, flag, flag, flag, cross_field_issues=cross_issues.iloc[::-1])
+
+    assert issues.tolist() == [
+        [],
+        ["ssn_invalid", "amount_invalid", "date_invalid", "code_1099r_invalid", "cross_code_g_taxable_over_10pct"],
+        [],
+    ]
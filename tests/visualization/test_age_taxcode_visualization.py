@@ -5,6 +5,7 @@ from src.visualization.age_taxcode_visualization import (
     build_age_taxcode_kpi_summary,
     build_term_date_correction_metrics,
     build_correction_reason_crosstab,
+    _count_labels,
 )
 
 
@@ -125,3 +126,22 @@ def test_build_correction_reason_crosstab_missing_columns() -> None:
         build_correction_reason_crosstab(
             pd.DataFrame({"match_status": ["match_needs_correction"]})
         )
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        ["7", None, "G", "7", None, "G", "4"],
+        [None, "Unknown", "7", None],
+        ["7", "G", "7"],
+        [None, None],
+    ],
+)
+def test_count_labels_matches_value_counts(values) -> None:
+    series = pd.Series(values, dtype="string")
+
+    labels, counts = _count_labels(series)
+
+    expected = series.fillna("Unknown").value_counts(sort=True)
+    assert labels == [str(label) for label in expected.index]
+    assert counts.tolist() == expected.tolist()